@@ -5,8 +5,12 @@ Self-bootstrapping: creates DB file, tables, indexes, and constraints on first r
 from __future__ import annotations
 
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 # Default DB path: project directory
 _DEFAULT_DB_PATH = Path(__file__).resolve().parent / "spaztick.db"
@@ -14,6 +18,9 @@ _DEFAULT_DB_PATH = Path(__file__).resolve().parent / "spaztick.db"
 # Wait up to this many seconds for locks (web + Telegram often use same DB)
 _CONNECT_TIMEOUT = 30.0
 
+# Max ids per "IN (?, ...)" query in the bulk lookups; older SQLite builds allow at most 999 bound parameters per statement
+IN_CHUNK = 900
+
 _SCHEMA = """
 -- Primary table: tasks
 -- status: incomplete | complete (new tasks are always incomplete)
@@ -116,17 +123,55 @@ CREATE INDEX IF NOT EXISTS idx_saved_lists_short_id ON saved_lists(short_id);
 """
 
 
+# database_path from config.json, cached briefly: every connection needs it and loading config parses the file.
+# The TTL keeps the Telegram subprocess in step with changes saved from the web UI.
+_DB_PATH_TTL_SECONDS = 60.0
+_db_path_cache: tuple[float, Path] | None = None
+_db_path_lock = threading.Lock()
+
+
 def get_db_path() -> Path:
     """Return the database file path (from config if available)."""
+    global _db_path_cache
+    now = time.monotonic()
+    cached = _db_path_cache
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    db_path = _DEFAULT_DB_PATH
     try:
         from config import load as load_config
         c = load_config()
         path = getattr(c, "database_path", None)
         if path:
-            return Path(path)
+            db_path = Path(path)
     except Exception:
         pass
-    return _DEFAULT_DB_PATH
+    with _db_path_lock:
+        _db_path_cache = (now + _DB_PATH_TTL_SECONDS, db_path)
+    return db_path
+
+
+def clear_db_path_cache() -> None:
+    """Drop the cached database path (call after saving config)."""
+    global _db_path_cache
+    with _db_path_lock:
+        _db_path_cache = None
+
+
+# (whole second, formatted) for now_iso: timestamps have one-second resolution, so each second is formatted once.
+_now_iso_cache: tuple[int, str] = (0, "")
+
+
+def now_iso() -> str:
+    """Current UTC time as YYYY-MM-DDTHH:MM:SSZ, the format stored in created_at/updated_at columns."""
+    global _now_iso_cache
+    sec = int(time.time())
+    cached = _now_iso_cache
+    if cached[0] == sec:
+        return cached[1]
+    value = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    _now_iso_cache = (sec, value)
+    return value
 
 
 def init_database(path: Path | None = None) -> Path:
@@ -270,18 +315,45 @@ def has_number_column(conn: sqlite3.Connection) -> bool:
         return False
 
 
+# Database files this process has already initialized and migrated; get_connection skips that work for them.
+_initialized_paths: set[Path] = set()
+_init_lock = threading.Lock()
+
+
 def get_connection(path: Path | None = None) -> sqlite3.Connection:
-    """Return a connection to the database. Call init_database first if needed."""
+    """Return a connection to the database. Schema init and migrations run on the first connection to each file per
+    process (or again if the file has been removed); later calls only connect."""
     db_path = path or get_db_path()
-    init_database(db_path)
+    first = db_path not in _initialized_paths or not db_path.exists()
+    if first:
+        with _init_lock:
+            init_database(db_path)
     conn = sqlite3.connect(str(db_path), timeout=_CONNECT_TIMEOUT)
     conn.execute("PRAGMA journal_mode=WAL")
+    # WAL only needs fsync at checkpoints; NORMAL keeps the database consistent and skips the per-commit sync.
+    conn.execute("PRAGMA synchronous=NORMAL")
     conn.row_factory = sqlite3.Row
-    _ensure_number_column(conn)  # run migration on this connection so it sees the column
-    _migrate_status_to_incomplete_complete(conn)  # ensure tasks.status is incomplete|complete
+    if first:
+        _ensure_number_column(conn)  # run migration on this connection so it sees the column
+        _migrate_status_to_incomplete_complete(conn)  # ensure tasks.status is incomplete|complete
+        with _init_lock:
+            _initialized_paths.add(db_path)
     return conn
 
 
+@contextmanager
+def connection(conn: sqlite3.Connection | None = None) -> Iterator[sqlite3.Connection]:
+    """Yield conn when the caller already holds one (left open), else a new connection closed on exit. Lets one request share a connection across service calls."""
+    if conn is not None:
+        yield conn
+        return
+    conn = get_connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
 def migrate() -> Path:
     """Run database init + migrations. Use this to migrate manually: python -m database"""
     return init_database()
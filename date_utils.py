@@ -3,6 +3,7 @@ Resolve relative date strings ('today', 'tomorrow') to ISO dates (YYYY-MM-DD) in
 """
 from __future__ import annotations
 
+import functools
 import re
 from datetime import date, datetime, timedelta
 from typing import Any
@@ -173,6 +174,22 @@ def resolve_relative_date(value: str | None, tz_name: str = "UTC") -> str | None
     return None
 
 
+@functools.lru_cache(maxsize=128)
+def _resolve_relative_date_on(value: str, tz_name: str, day: str) -> str | None:
+    return resolve_relative_date(value, tz_name)
+
+
+def resolve_relative_date_cached(value: str | None, tz_name: str = "UTC") -> str | None:
+    """resolve_relative_date memoized per (value, time zone, today's date there); the key changes at midnight, so stale answers are never reused."""
+    if not value or not str(value).strip():
+        return None
+    try:
+        day = _today_in_tz(tz_name)
+    except Exception:
+        day = date.today()
+    return _resolve_relative_date_on(str(value), tz_name, day.isoformat())
+
+
 def _parse_one_date_condition(raw: str, today: date, tz_name: str) -> dict[str, Any]:
     """Parse a single when phrase (no " and "). Used by parse_date_condition."""
     out: dict[str, Any] = {}
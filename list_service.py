@@ -9,19 +9,14 @@ import json
 import re
 import sqlite3
 import uuid
-from datetime import datetime, timezone
 from typing import Any
 
-from database import get_connection
+from database import get_connection, now_iso as _now_iso
 from date_utils import resolve_date_expression
 
 SHORT_ID_MAX_LEN = 4
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-
 def _list_row_to_dict(row: Any) -> dict[str, Any]:
     d = dict(row)
     for key in ("query_definition", "sort_definition"):
@@ -4,14 +4,79 @@ AI never writes directly to the database; all mutations go through task_service.
 """
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import html
 import json
 import logging
+import os
 import re
-from typing import Any
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Callable
+
+import httpx
+
+from config import load as load_config
+from database import connection, get_connection
+from date_utils import (
+    format_date_friendly,
+    format_datetime_info,
+    parse_date_condition,
+    resolve_relative_date_cached,
+    resolve_task_dates,
+)
+from list_service import get_list, list_lists as list_lists_svc, run_list
+from project_service import (
+    create_project,
+    delete_project,
+    get_project_by_short_id,
+    get_project_by_short_id_cached,
+    get_projects_cached,
+    list_projects,
+    update_project,
+)
+from task_service import (
+    add_task_project,
+    add_task_tag,
+    complete_recurring_task,
+    create_task as svc_create_task,
+    delete_task,
+    get_task_by_number,
+    get_tasks,
+    get_tasks_that_depend_on,
+    get_tasks_that_depend_on_bulk,
+    list_tasks as svc_list_tasks,
+    remove_task_project,
+    remove_task_tag,
+    tag_delete as svc_tag_delete,
+    tag_list as svc_tag_list,
+    tag_rename as svc_tag_rename,
+    update_task,
+)
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    _dumps = json.dumps
 
 logger = logging.getLogger("orchestrator")
 
+_JSON_DECODER = json.JSONDecoder()
+# _extract_json_object only looks for an object starting within this many characters of the response.
+_JSON_SCAN_MAX = 16384
+
 # --- Intent router: classifies user message as TOOL or CHAT ---
 INTENT_ROUTER_PROMPT = """You are the Spaztick Intent Router.
 
@@ -218,12 +283,40 @@ TOOL_ORCHESTRATOR_PROMPT = TOOL_ORCHESTRATOR_INTRO + AVAILABLE_TOOLS_SECTION
 
 
 # task_create schema: required title; optional description, notes, priority (0-3 or label high/medium high/medium low/low or color red/orange/yellow/green), projects[], tags[], available_date, due_date, flagged (default false). Status is always incomplete on create.
-TASK_CREATE_STATUS = frozenset({"incomplete"})
+TASK_CREATE_STATUS = ("incomplete",)
+# Lowercased string forms the model uses for booleans (confirm, flagged, available_by_required).
+_TRUTHY = frozenset({"true", "yes", "1"})
+_FALSY = frozenset({"false", "no", "0"})
+
+# Columns the task/project list formatters read; list paths select only these (no description/notes).
+_TASK_LIST_FIELDS = ["number", "title", "status", "priority", "flagged", "available_date", "due_date"]
+_PROJECT_LIST_FIELDS = ["id", "short_id", "name", "status", "updated_at"]
 
 # project_create: required title (project name); optional description. Status defaults to active (open).
 PROJECT_CREATE_STATUS = frozenset({"active", "archived"})
 
 
+def _norm(value: Any) -> str | None:
+    """str(value).strip(), or None when value is None or blank."""
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+
+def _coerce_bool(value: Any, default: bool | None = None) -> bool | None:
+    """Boolean from True/False, 1/0 or a true/yes/1 / false/no/0 string (any case, padded); default for anything else."""
+    if value is True or value is False:
+        return value
+    if isinstance(value, str):
+        s = value.strip().lower()
+        return True if s in _TRUTHY else False if s in _FALSY else default
+    if value == 1:
+        return True
+    if value == 0:
+        return False
+    return default
+
+
 def _parse_task_number(params: dict[str, Any]) -> int | None:
     """Parse task friendly id (number) from params. Accepts number, task_number; value can be int or string like '1' or '#1'."""
     raw = params.get("number") or params.get("task_number")
@@ -277,11 +370,8 @@ def _parse_priority(value: Any) -> int | None:
 
 def _validate_task_list_params(params: dict[str, Any], tz_name: str = "UTC") -> dict[str, Any]:
     """Normalize task_find/task retrieval parameters: default status incomplete, resolve dates and project short_id. Overdue = due_by (reference date - 1 day)."""
-    from datetime import date, timedelta
-    from date_utils import resolve_relative_date
     out: dict[str, Any] = {}
-    raw_status = (params.get("status") or "incomplete")
-    raw_status = str(raw_status).strip().lower() if raw_status else "incomplete"
+    raw_status = (_norm(params.get("status")) or "incomplete").lower()
     if raw_status == "all":
         out["status"] = None  # no filter: return incomplete and complete
     elif raw_status in ("incomplete", "complete"):
@@ -289,29 +379,29 @@ def _validate_task_list_params(params: dict[str, Any], tz_name: str = "UTC") ->
     else:
         out["status"] = "incomplete"
     # Tags: single "tag" or list "tags" with optional "tag_mode" ("any" = OR, "all" = AND)
-    tag = params.get("tag")
+    tag = _norm(params.get("tag"))
     tags_raw = params.get("tags") or []
     if isinstance(tags_raw, str):
         tags_raw = [tags_raw] if tags_raw.strip() else []
-    if tag is not None and str(tag).strip() and not tags_raw:
-        tags_raw = [str(tag).strip()]
+    if tag and not tags_raw:
+        tags_raw = [tag]
     if tags_raw:
-        out["tags"] = [str(t).strip() for t in tags_raw if str(t).strip()]
-        tag_mode = (params.get("tag_mode") or "any").strip().lower()
+        out["tags"] = [t for x in tags_raw if (t := _norm(x))]
+        tag_mode = (_norm(params.get("tag_mode")) or "any").lower()
         out["tag_mode"] = "all" if tag_mode == "all" else "any"
-    elif tag and str(tag).strip():
-        out["tag"] = str(tag).strip()
+    elif tag:
+        out["tag"] = tag
     # Projects: single "project"/"short_id" or list "projects"/"short_ids" with optional "project_mode" ("any" = OR, "all" = AND)
-    project = params.get("project") or params.get("short_id")
+    project = _norm(params.get("project") or params.get("short_id"))
     projects_raw = params.get("projects") or params.get("short_ids") or []
     if isinstance(projects_raw, str):
         projects_raw = [projects_raw] if projects_raw.strip() else []
-    if project is not None and str(project).strip() and not projects_raw:
-        projects_raw = [str(project).strip()]
+    if project and not projects_raw:
+        projects_raw = [project]
     if projects_raw:
         resolved_ids: list[str] = []
         for raw in projects_raw:
-            raw = str(raw).strip()
+            raw = _norm(raw)
             if not raw:
                 continue
             if raw.lower() == "inbox":
@@ -319,24 +409,22 @@ def _validate_task_list_params(params: dict[str, Any], tz_name: str = "UTC") ->
                 resolved_ids = []
                 break
             try:
-                from project_service import get_project_by_short_id
-                p = get_project_by_short_id(raw)
+                p = get_project_by_short_id_cached(raw)
                 if p:
                     resolved_ids.append(p["id"])
             except Exception:
                 pass
         if not out.get("inbox") and resolved_ids:
             out["project_ids"] = resolved_ids
-            project_mode = (params.get("project_mode") or "any").strip().lower()
+            project_mode = (_norm(params.get("project_mode")) or "any").lower()
             out["project_mode"] = "all" if project_mode == "all" else "any"
-    elif project and str(project).strip():
-        raw = str(project).strip()
+    elif project:
+        raw = project
         if raw.lower() == "inbox":
             out["inbox"] = True
         else:
             try:
-                from project_service import get_project_by_short_id
-                p = get_project_by_short_id(raw)
+                p = get_project_by_short_id_cached(raw)
                 if p:
                     out["project_id"] = p["id"]
             except Exception:
@@ -344,11 +432,12 @@ def _validate_task_list_params(params: dict[str, Any], tz_name: str = "UTC") ->
     # Overdue: tasks due before reference date → due_by = (reference - 1 day). "overdue" or "overdue today" → due_by yesterday; "overdue tomorrow" → due_by today.
     if "overdue" in params and params.get("overdue") is not None:
         ref = params.get("overdue")
-        if ref is True or (isinstance(ref, str) and str(ref).strip().lower() in ("true", "1", "today", "now", "")):
+        ref_s = str(ref).strip() if ref else ""
+        if ref is True or not ref_s or (isinstance(ref, str) and ref_s.lower() in ("true", "1", "today", "now")):
             ref = "today"
         else:
-            ref = str(ref).strip() if ref else "today"
-        resolved_ref = resolve_relative_date(ref, tz_name)
+            ref = ref_s
+        resolved_ref = resolve_relative_date_cached(ref, tz_name)
         if resolved_ref:
             try:
                 d = date.fromisoformat(resolved_ref)
@@ -358,24 +447,22 @@ def _validate_task_list_params(params: dict[str, Any], tz_name: str = "UTC") ->
     for key in ("due_by", "due_before", "due_on", "available_by", "available_or_due_by", "completed_by", "completed_after"):
         if key in out:
             continue  # already set (e.g. from overdue)
-        val = params.get(key)
-        if val is None or not str(val).strip():
+        val = _norm(params.get(key))
+        if val is None:
             continue
-        resolved = resolve_relative_date(str(val).strip(), tz_name)
+        resolved = resolve_relative_date_cached(val, tz_name)
         if resolved:
             out[key] = resolved
-    if params.get("available_by_required") in (True, 1) or (isinstance(params.get("available_by_required"), str) and str(params.get("available_by_required")).strip().lower() in ("true", "1", "yes")):
+    if _coerce_bool(params.get("available_by_required")):
         out["available_by_required"] = True
-    if params.get("title_contains") is not None and str(params["title_contains"]).strip():
-        out["title_contains"] = str(params["title_contains"]).strip()
-    if params.get("sort_by") and str(params["sort_by"]).strip():
-        out["sort_by"] = str(params["sort_by"]).strip()
+    for key in ("title_contains", "sort_by"):
+        val = _norm(params.get(key))
+        if val:
+            out[key] = val
     if "flagged" in params:
-        f = params["flagged"]
-        if f is True or (isinstance(f, str) and str(f).strip().lower() in ("true", "1", "yes")) or f == 1:
-            out["flagged"] = True
-        elif f is False or (isinstance(f, str) and str(f).strip().lower() in ("false", "0", "no")) or f == 0:
-            out["flagged"] = False
+        flagged = _coerce_bool(params["flagged"])
+        if flagged is not None:
+            out["flagged"] = flagged
     if "priority" in params and params["priority"] is not None:
         p = _parse_priority(params["priority"])
         if p is not None:
@@ -390,7 +477,6 @@ def _validate_task_list_params(params: dict[str, Any], tz_name: str = "UTC") ->
         except (ValueError, TypeError):
             continue
         try:
-            from task_service import get_task_by_number
             t = get_task_by_number(num)
             if t and t.get("id"):
                 out[out_key] = t["id"]
@@ -399,23 +485,27 @@ def _validate_task_list_params(params: dict[str, Any], tz_name: str = "UTC") ->
     return out
 
 
+# (pattern, at_end) pairs tried in order by _extract_tag_from_when; at_end patterns strip a trailing "and tagged X".
+_WHEN_TAG_RES = (
+    (re.compile(r"\s+and\s+tagged\s+(\w+)\s*$", re.I), True),
+    (re.compile(r"^tagged\s+(\w+)\s+and\s+", re.I), False),
+    (re.compile(r"\s+and\s+tag\s+(\w+)\s*$", re.I), True),
+    (re.compile(r"^tag\s+(\w+)\s+and\s+", re.I), False),
+)
+_WHEN_PREFIX_RE = re.compile(r"^(due|available)\s+")
+_WHEN_DUE_WITHIN_RE = re.compile(r"^due\s+within\s+")
+
+
 def _extract_tag_from_when(when: str) -> tuple[str, str | None]:
     """If when contains ' and tagged X' or 'tagged X and ', extract the tag and return (when_without_tag, tag). Otherwise return (when, None)."""
     if not when or not when.strip():
         return (when or "", None)
     raw = when.strip()
-    m = re.search(r"\s+and\s+tagged\s+(\w+)\s*$", raw, re.I)
-    if m:
-        return (raw[: m.start()].strip(), m.group(1).strip())
-    m = re.search(r"^tagged\s+(\w+)\s+and\s+", raw, re.I)
-    if m:
-        return (raw[m.end() :].strip(), m.group(1).strip())
-    m = re.search(r"\s+and\s+tag\s+(\w+)\s*$", raw, re.I)
-    if m:
-        return (raw[: m.start()].strip(), m.group(1).strip())
-    m = re.search(r"^tag\s+(\w+)\s+and\s+", raw, re.I)
-    if m:
-        return (raw[m.end() :].strip(), m.group(1).strip())
+    for pattern, at_end in _WHEN_TAG_RES:
+        m = pattern.search(raw)
+        if m:
+            rest = raw[: m.start()] if at_end else raw[m.end() :]
+            return (rest.strip(), m.group(1).strip())
     return (raw, None)
 
 
@@ -425,16 +515,14 @@ def _parse_when_to_task_list_params(when: str, tz_name: str = "UTC") -> dict[str
     Uses date_utils.parse_date_condition for broad NL support: "due Friday", "due before next Friday",
     "available today" (with available_by_required so only tasks with an available date on or before today), etc.
     """
-    from date_utils import parse_date_condition
     out = parse_date_condition(when, tz_name)
     if out:
         return out
     # Fallback: try legacy resolve_relative_date for bare phrases
-    from date_utils import resolve_relative_date
     raw = str(when).strip().lower()
-    date_expr = re.sub(r"^(due|available)\s+", "", raw).strip()
-    date_expr = re.sub(r"^due\s+within\s+", "within ", date_expr)
-    resolved = resolve_relative_date(date_expr, tz_name)
+    date_expr = _WHEN_PREFIX_RE.sub("", raw).strip()
+    date_expr = _WHEN_DUE_WITHIN_RE.sub("within ", date_expr)
+    resolved = resolve_relative_date_cached(date_expr, tz_name)
     if resolved:
         if raw.startswith("available"):
             return {"available_by": resolved, "available_by_required": False}
@@ -444,67 +532,92 @@ def _parse_when_to_task_list_params(when: str, tz_name: str = "UTC") -> dict[str
 
 def _parse_confirm(params: dict[str, Any]) -> bool:
     """True if user confirmed (confirm: true or yes)."""
-    c = params.get("confirm")
-    if c is True:
-        return True
-    if isinstance(c, str) and c.strip().lower() in ("true", "yes", "1"):
-        return True
-    return False
+    return _coerce_bool(params.get("confirm"), False)
+
+
+def _tc_text(key: str) -> Callable[[Any, dict[str, Any]], None]:
+    def handle(v: Any, out: dict[str, Any]) -> None:
+        if v is not None:
+            out[key] = str(v)
+    return handle
+
+
+def _tc_date(key: str) -> Callable[[Any, dict[str, Any]], None]:
+    def handle(v: Any, out: dict[str, Any]) -> None:
+        if v is not None:
+            out[key] = _norm(v)
+    return handle
+
+
+def _clean_str_list(xs: list[Any]) -> list[str]:
+    """Stripped non-empty strings from xs, first occurrence only, in order."""
+    return list(dict.fromkeys(item for x in xs if (item := _norm(x))))
+
+
+def _tc_list(key: str) -> Callable[[Any, dict[str, Any]], None]:
+    def handle(v: Any, out: dict[str, Any]) -> None:
+        if v is None:
+            return
+        if not isinstance(v, list):
+            raise ValueError(f"{key} must be an array")
+        out[key] = _clean_str_list(v)
+    return handle
+
+
+def _tc_status(v: Any, out: dict[str, Any]) -> None:
+    if v is not None:
+        s = (_norm(v) or "").lower()
+        if s not in TASK_CREATE_STATUS:
+            raise ValueError(f"status must be one of {sorted(TASK_CREATE_STATUS)}")
+        out["status"] = s
+
+
+def _tc_priority(v: Any, out: dict[str, Any]) -> None:
+    p = _parse_priority(v)
+    if p is not None:
+        out["priority"] = p
+
+
+def _tc_flagged(v: Any, out: dict[str, Any]) -> None:
+    out["flagged"] = _coerce_bool(v, False)
+
+
+# task_create parameter handlers, applied only to the keys the model actually sent.
+# title is checked up front; project/short_id are applied after the loop because they add to projects.
+_TASK_CREATE_FIELDS: dict[str, Callable[[Any, dict[str, Any]], None]] = {
+    "description": _tc_text("description"),
+    "notes": _tc_text("notes"),
+    "status": _tc_status,
+    "priority": _tc_priority,
+    "projects": _tc_list("projects"),
+    "tags": _tc_list("tags"),
+    "available_date": _tc_date("available_date"),
+    "due_date": _tc_date("due_date"),
+    "flagged": _tc_flagged,
+}
+_TASK_CREATE_PROJECT_REF_KEYS = ("project", "short_id")
 
 
 def _validate_task_create(params: dict[str, Any]) -> dict[str, Any]:
     """Validate and normalize task_create parameters. Raises ValueError if invalid."""
     if not isinstance(params, dict):
         raise ValueError("parameters must be an object")
-    title = params.get("title")
-    if not title or not str(title).strip():
+    title = _norm(params.get("title"))
+    if not title:
         raise ValueError("title is required")
-    out: dict[str, Any] = {"title": str(title).strip()}
-    if "description" in params and params["description"] is not None:
-        out["description"] = str(params["description"])
-    if "notes" in params and params["notes"] is not None:
-        out["notes"] = str(params["notes"])
-    status = params.get("status")
-    if status is not None:
-        s = str(status).strip().lower()
-        if s not in TASK_CREATE_STATUS:
-            raise ValueError(f"status must be one of {sorted(TASK_CREATE_STATUS)}")
-        out["status"] = s
-    else:
-        out["status"] = "incomplete"
-    if "priority" in params and params["priority"] is not None and str(params["priority"]).strip() != "":
-        p = _parse_priority(params["priority"])
-        if p is not None:
-            out["priority"] = p
-    if "projects" in params and params["projects"] is not None:
-        if not isinstance(params["projects"], list):
-            raise ValueError("projects must be an array")
-        out["projects"] = [str(x) for x in params["projects"] if str(x).strip()]
-    if "project" in params and params["project"] is not None and str(params["project"]).strip():
-        ref = str(params["project"]).strip()
-        if ref.lower() != "inbox":
-            out["projects"] = out.get("projects") or []
-            out["projects"].append(ref)
-    if "short_id" in params and params["short_id"] is not None and str(params["short_id"]).strip():
-        ref = str(params["short_id"]).strip()
-        if ref.lower() != "inbox":
-            out["projects"] = out.get("projects") or []
-            if ref not in out["projects"]:
-                out["projects"].append(ref)
-    if "tags" in params and params["tags"] is not None:
-        if not isinstance(params["tags"], list):
-            raise ValueError("tags must be an array")
-        out["tags"] = [str(x) for x in params["tags"] if str(x).strip()]
-    if "available_date" in params and params["available_date"] is not None:
-        out["available_date"] = str(params["available_date"]).strip() or None
-    if "due_date" in params and params["due_date"] is not None:
-        out["due_date"] = str(params["due_date"]).strip() or None
-    if "flagged" in params:
-        f = params["flagged"]
-        if f is True or (isinstance(f, str) and str(f).strip().lower() in ("true", "1", "yes")) or f == 1:
-            out["flagged"] = True
-        else:
-            out["flagged"] = False
+    out: dict[str, Any] = {"title": title, "status": "incomplete"}
+    for key, v in params.items():
+        handle = _TASK_CREATE_FIELDS.get(key)
+        if handle is not None:
+            handle(v, out)
+        elif key != "title" and key not in _TASK_CREATE_PROJECT_REF_KEYS:
+            logger.debug("task_create: ignoring unknown parameter %r", key)
+    for key in _TASK_CREATE_PROJECT_REF_KEYS:
+        ref = _norm(params.get(key))
+        if ref and ref.lower() != "inbox":
+            projects = out.setdefault("projects", [])
+            if key == "project" or ref not in projects:
+                projects.append(ref)
     return out
 
 
@@ -512,15 +625,15 @@ def _validate_project_create(params: dict[str, Any]) -> dict[str, Any]:
     """Validate and normalize project_create parameters. Raises ValueError if invalid. Uses 'title' as project name."""
     if not isinstance(params, dict):
         raise ValueError("parameters must be an object")
-    title = params.get("title") or params.get("name")
-    if not title or not str(title).strip():
+    title = _norm(params.get("title") or params.get("name"))
+    if not title:
         raise ValueError("title is required")
-    out: dict[str, Any] = {"title": str(title).strip()}
-    if "description" in params and params["description"] is not None:
-        out["description"] = str(params["description"]).strip() or None
+    out: dict[str, Any] = {"title": title}
+    if params.get("description") is not None:
+        out["description"] = _norm(params["description"])
     status = params.get("status")
     if status is not None:
-        s = str(status).strip().lower()
+        s = (_norm(status) or "").lower()
         if s == "open":
             s = "active"
         if s not in PROJECT_CREATE_STATUS:
@@ -531,6 +644,62 @@ def _validate_project_create(params: dict[str, Any]) -> dict[str, Any]:
     return out
 
 
+def _tu_status(v: Any, out: dict[str, Any]) -> None:
+    if v is None:
+        return
+    s = (_norm(v) or "").lower()
+    if s in ("done", "complete", "completed", "finished"):
+        out["status"] = "complete"
+    elif s in ("reopen", "incomplete", "open", "in progress"):
+        out["status"] = "incomplete"
+
+
+def _tu_text(key: str, clearable: bool = False) -> Callable[[Any, dict[str, Any]], None]:
+    def handle(v: Any, out: dict[str, Any]) -> None:
+        if v is not None:
+            val = _norm(v)
+            if val is not None or clearable:
+                out[key] = val
+    return handle
+
+
+def _tu_list(key: str) -> Callable[[Any, dict[str, Any]], None]:
+    def handle(v: Any, out: dict[str, Any]) -> None:
+        if v is None:
+            return
+        if not isinstance(v, list):
+            raise ValueError(f"{key} must be an array of project short_ids or ids")
+        out[key] = _clean_str_list(v)
+    return handle
+
+
+def _tu_tags(v: Any, out: dict[str, Any]) -> None:
+    if v is None:
+        return
+    if isinstance(v, str):
+        v = [v] if v.strip() else []
+    if not isinstance(v, list):
+        raise ValueError("tags must be an array of strings or a single string")
+    out["tags"] = _clean_str_list(v)
+
+
+# task_update parameter handlers, applied only to the keys the model actually sent (number is parsed up front).
+# Blank due_date/available_date are kept as None so the update clears them.
+_TASK_UPDATE_FIELDS: dict[str, Callable[[Any, dict[str, Any]], None]] = {
+    "status": _tu_status,
+    "flagged": _tc_flagged,
+    "due_date": _tu_text("due_date", clearable=True),
+    "available_date": _tu_text("available_date", clearable=True),
+    "title": _tu_text("title"),
+    "description": _tu_text("description"),
+    "notes": _tu_text("notes"),
+    "priority": _tc_priority,
+    "projects": _tu_list("projects"),
+    "remove_projects": _tu_list("remove_projects"),
+    "tags": _tu_tags,
+}
+
+
 def _validate_task_update(params: dict[str, Any], tz_name: str = "UTC") -> dict[str, Any]:
     """Validate and normalize task_update parameters. number required; optional status, flagged, due_date, available_date, title, description, notes, priority, projects (list), remove_projects (list), tags (list). Raises ValueError if number missing."""
     if not isinstance(params, dict):
@@ -539,73 +708,49 @@ def _validate_task_update(params: dict[str, Any], tz_name: str = "UTC") -> dict[
     if num is None:
         raise ValueError("number is required (task's friendly id, e.g. 1)")
     out: dict[str, Any] = {"number": num}
-    status = params.get("status")
-    if status is not None:
-        s = str(status).strip().lower()
-        if s in ("done", "complete", "completed", "finished"):
-            out["status"] = "complete"
-        elif s in ("reopen", "incomplete", "open", "in progress"):
-            out["status"] = "incomplete"
-        elif s in ("incomplete", "complete"):
-            out["status"] = s
-    if "flagged" in params:
-        f = params["flagged"]
-        if f is True or (isinstance(f, str) and str(f).strip().lower() in ("true", "1", "yes")) or f == 1:
-            out["flagged"] = True
-        else:
-            out["flagged"] = False
-    for key in ("due_date", "available_date", "title", "description", "notes"):
-        if key in params and params[key] is not None:
-            val = str(params[key]).strip() or None
-            if val is not None or key in ("due_date", "available_date"):
-                out[key] = val if val else None
-    if "priority" in params and params["priority"] is not None and str(params["priority"]).strip() != "":
-        p = _parse_priority(params["priority"])
-        if p is not None:
-            out["priority"] = p
-    if "projects" in params and params["projects"] is not None:
-        if not isinstance(params["projects"], list):
-            raise ValueError("projects must be an array of project short_ids or ids")
-        out["projects"] = [str(x).strip() for x in params["projects"] if str(x).strip()]
-    if "remove_projects" in params and params["remove_projects"] is not None:
-        if not isinstance(params["remove_projects"], list):
-            raise ValueError("remove_projects must be an array of project short_ids or ids")
-        out["remove_projects"] = [str(x).strip() for x in params["remove_projects"] if str(x).strip()]
-    if "tags" in params and params["tags"] is not None:
-        raw = params["tags"]
-        if isinstance(raw, str):
-            raw = [raw] if raw.strip() else []
-        if not isinstance(raw, list):
-            raise ValueError("tags must be an array of strings or a single string")
-        out["tags"] = [str(x).strip() for x in raw if str(x).strip()]
+    for key, v in params.items():
+        handle = _TASK_UPDATE_FIELDS.get(key)
+        if handle is not None:
+            handle(v, out)
     return out
 
 
 def _extract_json_object(text: str) -> dict | None:
-    """Find first balanced {...} in text and parse as JSON."""
+    """Parse the first valid JSON object in text (raw_decode stops at its closing brace, so trailing prose is ignored)."""
+    if "{" not in text:
+        return None
     text = text.strip()
-    if "```" in text:
-        text = re.sub(r"^```(?:json)?\s*", "", text)
-        text = re.sub(r"\s*```$", "", text).strip()
+    if text.startswith("```"):
+        # Fenced response: drop the opening fence (and json tag) and the closing fence when there is one.
+        text = text[3:].removeprefix("json").removesuffix("```").strip()
     start = text.find("{")
     if start < 0:
         return None
-    depth = 0
-    for i in range(start, len(text)):
-        if text[i] == "{":
-            depth += 1
-        elif text[i] == "}":
-            depth -= 1
-            if depth == 0:
-                try:
-                    return json.loads(text[start : i + 1])
-                except json.JSONDecodeError:
-                    return None
+    if text.endswith("}"):
+        # Usual case: the object runs to the end of the response, so one (orjson when available) parse does it.
+        try:
+            obj = _loads(text[start:] if start else text)
+        except ValueError:
+            pass
+        else:
+            return obj if isinstance(obj, dict) else None
+    # Otherwise take the first '{' that starts a valid object (prose like "use {title}" before the JSON is skipped).
+    # Only braces near the start are tried, so a runaway response full of braces can't turn into many decode attempts.
+    while 0 <= start < _JSON_SCAN_MAX:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+            continue
+        return obj if isinstance(obj, dict) else None
     return None
 
 
 def _parse_tool_call(response_text: str) -> tuple[str, dict[str, Any]] | None:
     """Extract a proper tool call from the response. Returns (name, parameters) or None. Only accepts explicit form: {"name": "task_create", "parameters": {...}}."""
+    # Clarification questions and other prose never contain the key, so skip parsing them entirely.
+    if not response_text or "{" not in response_text or ('"name"' not in response_text and '"tool"' not in response_text):
+        return None
     obj = _extract_json_object(response_text)
     if not obj or not isinstance(obj, dict):
         return None
@@ -766,14 +911,12 @@ def _extract_tasks_in_identifier(user_message: str) -> str | None:
 def _resolve_identifier_to_task_find_params(identifier: str) -> dict[str, Any]:
     """Resolve 'focu' or '1off' to task_find params: list_id if it's a list, short_id if it's a project. Prefer list when both exist."""
     try:
-        from list_service import get_list
         if get_list(identifier):
             return {"list_id": identifier}
     except Exception:
         pass
     try:
-        from project_service import get_project_by_short_id
-        if get_project_by_short_id(identifier):
+        if get_project_by_short_id_cached(identifier):
             return {"short_id": identifier, "status": "incomplete"}
     except Exception:
         pass
@@ -889,41 +1032,414 @@ def _infer_tool_from_user_message(user_message: str) -> tuple[str, dict[str, Any
     return None
 
 
+_CANONICAL_KEYS = (
+    "id", "title", "description", "notes", "status", "priority", "projects", "tags",
+    "available_date", "due_date", "created_at", "updated_at", "completed_at",
+)
+_CANONICAL_LIST_KEYS = frozenset({"projects", "tags"})
+
+
 def _canonical_task_response(task: dict[str, Any]) -> dict[str, Any]:
     """Format task for canonical JSON response (spec)."""
-    return {
-        "id": task.get("id"),
-        "title": task.get("title"),
-        "description": task.get("description"),
-        "notes": task.get("notes"),
-        "status": task.get("status"),
-        "priority": task.get("priority"),
-        "projects": task.get("projects", []),
-        "tags": task.get("tags", []),
-        "available_date": task.get("available_date"),
-        "due_date": task.get("due_date"),
-        "created_at": task.get("created_at"),
-        "updated_at": task.get("updated_at"),
-        "completed_at": task.get("completed_at"),
-    }
+    get = task.get
+    return {k: (get(k) or []) if k in _CANONICAL_LIST_KEYS else get(k) for k in _CANONICAL_KEYS}
+
+
+_FIRST_NON_SPACE_RE = re.compile(r"\S")
 
 
 def _looks_like_json(text: str) -> bool:
     """True if text looks like JSON (so we don't send it to the user)."""
-    t = text.strip()
-    return (t.startswith("{") and "}" in t) or (t.startswith("[") and "]" in t)
+    # Find the first non-whitespace character in place instead of copying the whole reply with strip().
+    m = _FIRST_NON_SPACE_RE.search(text)
+    if m is None:
+        return False
+    c = m.group()
+    if c == "{":
+        return text.find("}", m.end()) >= 0
+    if c == "[":
+        return text.find("]", m.end()) >= 0
+    return False
+
+
+# LLM request/response logging: the system prompt alone is several KB, so log lines are capped.
+_LOG_SYSTEM_MAX = 500
+_LOG_TEXT_MAX = 2000
+
+
+def _trunc(s: str, n: int) -> str:
+    return s if len(s) <= n else s[:n] + f"... [{len(s) - n} more chars]"
+
+
+def _log_llm_request(url: str, model: str, system: str, prompt: str) -> None:
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "LLM request → url=%s model=%s\n--- system ---\n%s\n--- prompt ---\n%s",
+            url, model, _trunc(system, _LOG_SYSTEM_MAX), _trunc(prompt, _LOG_TEXT_MAX),
+        )
+
+
+def _log_llm_response(text: str, cached: bool = False) -> None:
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("LLM response%s ←\n%s", " (cached)" if cached else "", _trunc(text, _LOG_TEXT_MAX))
+
+
+def _log_llm_timings(data: dict[str, Any]) -> None:
+    """Ollama's prompt/eval counts and durations (ns) from a final response. A low prompt_eval_count on repeat calls
+    means the server reused its cached evaluation of the unchanged system prompt prefix."""
+    if logger.isEnabledFor(logging.DEBUG) and "prompt_eval_count" in data:
+        logger.debug(
+            "LLM timings: prompt_eval_count=%s prompt_eval_ms=%.0f eval_count=%s eval_ms=%.0f",
+            data.get("prompt_eval_count"),
+            (data.get("prompt_eval_duration") or 0) / 1e6,
+            data.get("eval_count"),
+            (data.get("eval_duration") or 0) / 1e6,
+        )
+
+
+# Exact-match LLM response cache, enabled with SPAZTICK_LLM_CACHE=1. Only the model's response text is cached;
+# parsing, validation and the tool itself (DB reads/writes) always run again on a hit. Intent and chat calls are keyed
+# on the exact system prompt; tool-mode calls ignore the time of day in the callers' date line (see _DATE_LINE_RE),
+# since tools only work with dates, so they hit for the rest of the day instead of only within the same minute.
+_LLM_CACHE_MAX = 512
+_llm_cache: OrderedDict[str, str] = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+
+def _llm_cache_enabled() -> bool:
+    return os.environ.get("SPAZTICK_LLM_CACHE", "").strip().lower() in ("1", "true", "yes")
+
+
+# The date line the web app and Telegram bot put in the system prefix: "It is 2025-01-31 14:05 in the user's time zone X."
+_DATE_LINE_RE = re.compile(r"It is (\d{4}-\d{2}-\d{2}) \d{2}:\d{2} in the user's time zone [^\n]*")
+
+
+def _llm_cache_key(url: str, payload: dict[str, Any], day_only: bool = False) -> str:
+    """Cache key over everything that shapes the generation: model, system, prompt, format and options.
+    day_only (tool mode): the date line's time of day is left out, so the key changes once a day rather than every minute."""
+    if day_only and payload.get("system"):
+        payload = {**payload, "system": _DATE_LINE_RE.sub(r"It is \1", payload["system"])}
+    return hashlib.sha256((url + "\0" + json.dumps(payload, sort_keys=True)).encode("utf-8")).hexdigest()
+
+
+def _llm_cache_get(key: str) -> str | None:
+    with _llm_cache_lock:
+        text = _llm_cache.get(key)
+        if text is not None:
+            _llm_cache.move_to_end(key)
+        return text
+
+
+def _llm_cache_put(key: str, text: str) -> None:
+    with _llm_cache_lock:
+        _llm_cache[key] = text
+        _llm_cache.move_to_end(key)
+        while len(_llm_cache) > _LLM_CACHE_MAX:
+            _llm_cache.popitem(last=False)
+
+
+# Parsed tool calls for read-only tools, enabled with SPAZTICK_TOOL_CACHE=1. Keyed by endpoint, model, the user's local
+# date, the caller's system prefix without its per-minute date line, and the whitespace-normalized prompt (with history). A hit skips both the intent and tool-mode calls; the tool itself still runs, so results reflect the current
+# database. Mutating tools are never cached.
+_READ_ONLY_TOOLS = frozenset({
+    "task_find", "task_info", "project_list", "project_info", "project_archived", "list_lists", "tag_list",
+})
+_TOOL_CACHE_MAX = 512
+_tool_cache: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+_tool_cache_lock = threading.Lock()
+
+
+def _tool_cache_enabled() -> bool:
+    return os.environ.get("SPAZTICK_TOOL_CACHE", "").strip().lower() in ("1", "true", "yes")
+
+
+def _tool_cache_key(url: str, model: str, system_prefix: str, prompt: str) -> str | None:
+    """Cache key for a tool-mode turn, or None when the tool-call cache is disabled."""
+    if not _tool_cache_enabled():
+        return None
+    today = resolve_relative_date_cached("today", _user_timezone()) or ""
+    prefix = " ".join(_DATE_LINE_RE.sub("", system_prefix or "").split())
+    normalized = " ".join(prompt.split())
+    return hashlib.sha256("\0".join((url, model, today, prefix, normalized)).encode("utf-8")).hexdigest()
+
+
+def _tool_cache_get(key: str) -> tuple[str, dict[str, Any]] | None:
+    with _tool_cache_lock:
+        hit = _tool_cache.get(key)
+        if hit is None:
+            return None
+        _tool_cache.move_to_end(key)
+    return (hit[0], dict(hit[1]))
+
+
+def _tool_cache_put(key: str, parsed: tuple[str, dict[str, Any]]) -> None:
+    if parsed[0] not in _READ_ONLY_TOOLS:
+        return
+    with _tool_cache_lock:
+        _tool_cache[key] = (parsed[0], dict(parsed[1]))
+        _tool_cache.move_to_end(key)
+        while len(_tool_cache) > _TOOL_CACHE_MAX:
+            _tool_cache.popitem(last=False)
+
+
+# Keep the model (and its cached prompt prefix) loaded between requests so messages don't pay a reload.
+# Override with SPAZTICK_OLLAMA_KEEP_ALIVE (Ollama duration such as "5m", "1h", or "-1" for forever).
+OLLAMA_KEEP_ALIVE = os.environ.get("SPAZTICK_OLLAMA_KEEP_ALIVE", "").strip() or "30m"
+
+
+# Decoding settings per call. Intent and tool calls should be deterministic; num_predict caps runaway generations
+# ({"intent": ...} is a handful of tokens, a tool call a few hundred). Chat mode keeps the model's defaults.
+INTENT_OPTIONS: dict[str, Any] = {"temperature": 0, "num_predict": 32}
+TOOL_OPTIONS: dict[str, Any] = {"temperature": 0, "num_predict": 512}
+
+
+# Pooled sync httpx.Clients keyed by Ollama endpoint, so consecutive calls reuse keep-alive connections instead of reconnecting.
+_clients: dict[str, httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(url: str) -> httpx.Client:
+    """Return the shared httpx.Client for url (created on first use; safe to call from executor threads)."""
+    client = _clients.get(url)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(url)
+            if client is None:
+                client = httpx.Client(limits=httpx.Limits(max_keepalive_connections=4))
+                _clients[url] = client
+    return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close the pooled sync clients' keep-alive connections at interpreter exit."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
 
 
-def _call_ollama(system: str, prompt: str, url: str, model: str, timeout: float = 120.0) -> str:
+def _ollama_payload(
+    system: str,
+    prompt: str,
+    model: str,
+    fmt: str | None = None,
+    options: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Request body for Ollama /api/generate. fmt="json" turns on Ollama's JSON-constrained decoding."""
+    payload: dict[str, Any] = {"model": model, "prompt": prompt, "system": system, "stream": False, "keep_alive": OLLAMA_KEEP_ALIVE}
+    if fmt:
+        payload["format"] = fmt
+    if options:
+        payload["options"] = options
+    return payload
+
+
+def _call_ollama(
+    system: str,
+    prompt: str,
+    url: str,
+    model: str,
+    timeout: float = 120.0,
+    fmt: str | None = None,
+    options: dict[str, Any] | None = None,
+) -> str:
     """Call Ollama /api/generate with the given system and prompt. Returns response text or raises."""
-    import httpx
-    logger.info("LLM request → url=%s model=%s\n--- system ---\n%s\n--- prompt ---\n%s", url, model, system, prompt)
-    payload = {"model": model, "prompt": prompt, "system": system, "stream": False}
-    r = httpx.post(url, json=payload, timeout=timeout)
+    payload = _ollama_payload(system, prompt, model, fmt, options)
+    cache_key = _llm_cache_key(url, payload) if _llm_cache_enabled() else None
+    if cache_key is not None:
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            _log_llm_response(cached, cached=True)
+            return cached
+    _log_llm_request(url, model, system, prompt)
+    r = _get_client(url).post(url, json=payload, timeout=timeout)
+    r.raise_for_status()
+    data = _loads(r.content)
+    response_text = data.get("response", "")
+    _log_llm_response(response_text)
+    _log_llm_timings(data)
+    if cache_key is not None:
+        _llm_cache_put(cache_key, response_text)
+    return response_text
+
+
+# Pooled AsyncClients, one per (event loop, Ollama base URL): an AsyncClient's connections belong to the loop that opened them.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_client(base_url: str) -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient for base_url on the running event loop (created on first use)."""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    key = base_url.rstrip("/")
+    client = clients.get(key)
+    if client is None:
+        # Up to 16 requests in flight per Ollama server (concurrent chats, run_orchestrator_many/batch); 8 kept alive between turns.
+        client = httpx.AsyncClient(limits=httpx.Limits(max_connections=16, max_keepalive_connections=8))
+        clients[key] = client
+    return client
+
+
+async def _call_ollama_async(
+    client: httpx.AsyncClient,
+    system: str,
+    prompt: str,
+    url: str,
+    model: str,
+    timeout: float = 120.0,
+    fmt: str | None = None,
+    options: dict[str, Any] | None = None,
+) -> str:
+    """Async _call_ollama using the given httpx.AsyncClient. Returns response text or raises."""
+    payload = _ollama_payload(system, prompt, model, fmt, options)
+    cache_key = _llm_cache_key(url, payload) if _llm_cache_enabled() else None
+    if cache_key is not None:
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            _log_llm_response(cached, cached=True)
+            return cached
+    _log_llm_request(url, model, system, prompt)
+    r = await client.post(url, json=payload, timeout=timeout)
     r.raise_for_status()
-    data = r.json()
+    data = _loads(r.content)
     response_text = data.get("response", "")
-    logger.info("LLM response ←\n%s", response_text)
+    _log_llm_response(response_text)
+    _log_llm_timings(data)
+    if cache_key is not None:
+        _llm_cache_put(cache_key, response_text)
+    return response_text
+
+
+class _ToolCallStream:
+    """Collects streamed tool-mode output. feed() returns True once the text is a complete tool call, so the caller can
+    stop reading (closing the stream makes Ollama stop generating whatever prose the model would append). Only the first
+    top-level object is tracked, with string/escape state so braces inside JSON strings don't count."""
+
+    __slots__ = ("text", "_pos", "_depth", "_in_string", "_escape", "_done")
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._done = False
+
+    def feed(self, piece: str) -> bool:
+        self.text += piece
+        if self._done:
+            return False
+        text = self.text
+        depth, in_string, escape = self._depth, self._in_string, self._escape
+        end = None
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if in_string:
+                if escape:
+                    escape = False
+                elif c == "\\":
+                    escape = True
+                elif c == '"':
+                    in_string = False
+            elif c == "{":
+                depth += 1
+            elif depth:
+                if c == '"':
+                    in_string = True
+                elif c == "}":
+                    depth -= 1
+                    if depth == 0:
+                        end = i + 1
+                        break
+        self._pos, self._depth, self._in_string, self._escape = len(text), depth, in_string, escape
+        if end is None:
+            return False
+        # First object is closed: either it's the tool call (stop here) or the response is something else (read it all).
+        self._done = True
+        head = text.lstrip()
+        if not (head.startswith("{") or head.startswith("```")):
+            return False
+        obj = _extract_json_object(text[:end])
+        if obj and (obj.get("name") or obj.get("tool")):
+            self.text = text[:end]
+            return True
+        return False
+
+
+def _call_ollama_tool(
+    system: str,
+    prompt: str,
+    url: str,
+    model: str,
+    timeout: float = 120.0,
+    options: dict[str, Any] | None = None,
+) -> str:
+    """Tool-mode _call_ollama: streams the generation and stops as soon as a complete tool call has arrived. Returns response text or raises."""
+    payload = _ollama_payload(system, prompt, model, options=options)
+    payload["stream"] = True
+    cache_key = _llm_cache_key(url, payload, day_only=True) if _llm_cache_enabled() else None
+    if cache_key is not None:
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            _log_llm_response(cached, cached=True)
+            return cached
+    _log_llm_request(url, model, system, prompt)
+    collected = _ToolCallStream()
+    with _get_client(url).stream("POST", url, json=payload, timeout=timeout) as r:
+        r.raise_for_status()
+        for line in r.iter_lines():
+            if not line:
+                continue
+            data = _loads(line)
+            if collected.feed(data.get("response", "")):
+                logger.info("LLM tool call complete; closing stream early")
+                break
+            if data.get("done"):
+                _log_llm_timings(data)
+                break
+    response_text = collected.text
+    _log_llm_response(response_text)
+    if cache_key is not None:
+        _llm_cache_put(cache_key, response_text)
+    return response_text
+
+
+async def _call_ollama_tool_async(
+    client: httpx.AsyncClient,
+    system: str,
+    prompt: str,
+    url: str,
+    model: str,
+    timeout: float = 120.0,
+    options: dict[str, Any] | None = None,
+) -> str:
+    """Async _call_ollama_tool using the given httpx.AsyncClient. Returns response text or raises."""
+    payload = _ollama_payload(system, prompt, model, options=options)
+    payload["stream"] = True
+    cache_key = _llm_cache_key(url, payload, day_only=True) if _llm_cache_enabled() else None
+    if cache_key is not None:
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            _log_llm_response(cached, cached=True)
+            return cached
+    _log_llm_request(url, model, system, prompt)
+    collected = _ToolCallStream()
+    async with client.stream("POST", url, json=payload, timeout=timeout) as r:
+        r.raise_for_status()
+        async for line in r.aiter_lines():
+            if not line:
+                continue
+            data = _loads(line)
+            if collected.feed(data.get("response", "")):
+                logger.info("LLM tool call complete; closing stream early")
+                break
+            if data.get("done"):
+                _log_llm_timings(data)
+                break
+    response_text = collected.text
+    _log_llm_response(response_text)
+    if cache_key is not None:
+        _llm_cache_put(cache_key, response_text)
     return response_text
 
 
@@ -943,16 +1459,27 @@ def _parse_intent(response_text: str) -> str:
 def _friendly_date(iso_date: str | None, tz_name: str) -> str:
     """Today/yesterday/tomorrow or m/d for chat/Telegram."""
     try:
-        from date_utils import format_date_friendly
         return format_date_friendly(iso_date, tz_name)
     except Exception:
         return str(iso_date or "")
 
 
+def _friendly_date_memo(tz_name: str) -> Callable[[str], str]:
+    """Per-list _friendly_date: task lists repeat the same few dates, so each distinct date is formatted (and today resolved) once."""
+    memo: dict[str, str] = {}
+
+    def friendly(iso_date: str) -> str:
+        out = memo.get(iso_date)
+        if out is None:
+            out = memo[iso_date] = _friendly_date(iso_date, tz_name)
+        return out
+
+    return friendly
+
+
 def _format_datetime_info(iso_datetime: str | None, tz_name: str) -> str:
     """m/d/yyyy, h:mm am/pm for created/updated info."""
     try:
-        from date_utils import format_datetime_info
         return format_datetime_info(iso_datetime, tz_name)
     except Exception:
         return str(iso_datetime or "")
@@ -1000,47 +1527,44 @@ def _escape_telegram_markdown(s: str) -> str:
     return s
 
 
+def _project_short_id_labels(tasks: list[dict[str, Any]], escape: Callable[[str], str]) -> dict[str, str]:
+    """Escaped short_id (or id prefix) per project id referenced by tasks, loaded in one query for the whole list."""
+    pids = list(dict.fromkeys(pid for t in tasks for pid in t.get("projects") or ()))
+    labels: dict[str, str] = {}
+    for p in get_projects_cached(pids):
+        short_id = (p.get("short_id") or "").strip() or (p.get("id") or "")[:8]
+        if short_id:
+            labels[p["id"]] = escape(short_id)
+    return labels
+
+
 def _format_task_list_for_telegram(tasks: list[dict[str, Any]], max_show: int = 50, tz_name: str = "UTC") -> str:
     """Format task list for Telegram (native UI): bold header, emoji per line, monospace for dates. No fenced code block."""
     if not tasks:
         return "No tasks yet."
     total = len(tasks)
     show = tasks[:max_show]
-    try:
-        from project_service import get_project
-    except ImportError:
-        get_project = None
+    project_labels = _project_short_id_labels(show, _escape_telegram_markdown)
+    friendly = _friendly_date_memo(tz_name)
     # Bold header (PDF: **List: Focused (9)**)
     lines = [f"*Tasks ({total})*"]
     for t in show:
-        priority = t.get("priority")
-        prio_emoji = _priority_emoji(priority)
+        prio_emoji = _priority_emoji(t.get("priority"))
         flagged = t.get("flagged") in (1, True, "1")
-        status = t.get("status") or "incomplete"
-        status_icon = "■" if status == "complete" else "□"
-        flag_str = "★" if flagged else ""
+        status_icon = "■" if t.get("status") == "complete" else "□"
+        flag_part = "★ " if flagged else ""
         title = _escape_telegram_markdown((t.get("title") or "").strip() or "(no title)")
         num = t.get("number")
         num_str = f"({num})" if num is not None else f"({(t.get('id') or '')[:8]})"
-        if get_project and t.get("projects"):
-            short_ids = []
-            for pid in t["projects"]:
-                p = get_project(pid)
-                if p:
-                    short_id = (p.get("short_id") or "").strip() or (p.get("id") or "")[:8]
-                    if short_id:
-                        short_ids.append(_escape_telegram_markdown(short_id))
-            in_projects = ", ".join(short_ids) if short_ids else "inbox"
-        else:
-            in_projects = "inbox"
+        short_ids = [label for pid in t.get("projects") or () if (label := project_labels.get(pid))]
+        in_projects = ", ".join(short_ids) if short_ids else "inbox"
         date_parts = []
         if t.get("available_date"):
-            date_parts.append("a:" + _friendly_date(t["available_date"], tz_name))
+            date_parts.append("a:" + friendly(t["available_date"]))
         if t.get("due_date"):
-            date_parts.append("d:" + _friendly_date(t["due_date"], tz_name))
+            date_parts.append("d:" + friendly(t["due_date"]))
         date_block = f" `{' '.join(date_parts)}`" if date_parts else ""
-        line_content = f"{prio_emoji}{' ' if prio_emoji else ''}{flag_str}{' ' if flag_str else ''}{status_icon} {title} {num_str} in {in_projects}{date_block}"
-        lines.append(line_content)
+        lines.append(f"{prio_emoji} {flag_part}{status_icon} {title} {num_str} in {in_projects}{date_block}")
     if total > max_show:
         lines.append(f"... and {total - max_show} more.")
     return "\n".join(lines)
@@ -1050,61 +1574,38 @@ def _format_task_list_for_api(tasks: list[dict[str, Any]], max_show: int = 50, t
     """Format task list for API per PDF (native UI): bold header, emoji per line, monospace for dates. Output as HTML for client chat."""
     if not tasks:
         return "<p>No tasks yet.</p>"
-    try:
-        from date_utils import resolve_relative_date
-        today = resolve_relative_date("today", tz_name)
-    except Exception:
-        from datetime import date
-        today = date.today().isoformat()
-    if not today:
-        from datetime import date
-        today = date.today().isoformat()
+    today = resolve_relative_date_cached("today", tz_name) or date.today().isoformat()
     total = len(tasks)
     show = tasks[:max_show]
-    try:
-        from project_service import get_project
-    except ImportError:
-        get_project = None
+    project_labels = _project_short_id_labels(show, html.escape)
+    friendly = _friendly_date_memo(tz_name)
     # Bold header (PDF: **List: Focused (9)**)
     lines = [f"<p><strong>Tasks ({total})</strong></p>"]
     for t in show:
-        priority = t.get("priority")
-        prio_emoji = _priority_emoji(priority)
+        prio_emoji = _priority_emoji(t.get("priority"))
         flagged = t.get("flagged") in (1, True, "1")
-        status = t.get("status") or "incomplete"
-        status_icon = "■" if status == "complete" else "□"
-        flag_str = "★" if flagged else ""
+        status_icon = "■" if t.get("status") == "complete" else "□"
+        flag_part = "★ " if flagged else ""
         title = html.escape((t.get("title") or "").strip() or "(no title)")
         num = t.get("number")
         num_str = f"({num})" if num is not None else f"({(t.get('id') or '')[:8]})"
-        if get_project and t.get("projects"):
-            short_ids = []
-            for pid in t["projects"]:
-                p = get_project(pid)
-                if p:
-                    short_id = (p.get("short_id") or "").strip() or (p.get("id") or "")[:8]
-                    if short_id:
-                        short_ids.append(html.escape(short_id))
-            in_projects = ", ".join(short_ids) if short_ids else "inbox"
-        else:
-            in_projects = "inbox"
+        short_ids = [label for pid in t.get("projects") or () if (label := project_labels.get(pid))]
+        in_projects = ", ".join(short_ids) if short_ids else "inbox"
         # Monospace for dates (PDF: `a:2/18 d:yesterday`). d: colored if overdue/due today.
         date_parts = []
         if t.get("available_date"):
-            date_parts.append("a:" + html.escape(_friendly_date(t["available_date"], tz_name)))
+            date_parts.append("a:" + html.escape(friendly(t["available_date"])))
         due = t.get("due_date")
         if due:
-            due_friendly = html.escape(_friendly_date(due, tz_name))
+            due_friendly = html.escape(friendly(due))
             if due < today:
                 date_parts.append(f'<span style="color:red">d:{due_friendly}</span>')
             elif due == today:
                 date_parts.append(f'<span style="color:darkgoldenrod">d:{due_friendly}</span>')
             else:
                 date_parts.append("d:" + due_friendly)
-        date_part = " " + " ".join(date_parts) if date_parts else ""
-        date_block = f' <code>{date_part}</code>' if date_parts else ""
-        line_content = f"{prio_emoji}{' ' if prio_emoji else ''}{flag_str}{' ' if flag_str else ''}{status_icon} {title} {num_str} in {in_projects}{date_block}"
-        lines.append(f"<p>{line_content}</p>")
+        date_block = f" <code> {' '.join(date_parts)}</code>" if date_parts else ""
+        lines.append(f"<p>{prio_emoji} {flag_part}{status_icon} {title} {num_str} in {in_projects}{date_block}</p>")
     if total > max_show:
         lines.append(f"<p>... and {total - max_show} more.</p>")
     return "\n".join(lines)
@@ -1166,6 +1667,12 @@ def _format_recurrence_short(rec: Any) -> str | None:
     return " ".join(parts) if parts else "Recurring"
 
 
+def _format_task_refs(tasks: list[dict[str, Any]]) -> str:
+    """'number title' for each numbered task, comma-separated; short ids when none of them has a number."""
+    parts = [f"{t['number']} {(t.get('title') or '').strip() or '(no title)'}" for t in tasks if t.get("number") is not None]
+    return ", ".join(parts or [t.get("id", "")[:8] for t in tasks])
+
+
 def _format_task_info_text(
     task: dict[str, Any],
     parent_tasks: list[dict[str, Any]],
@@ -1178,42 +1685,27 @@ def _format_task_info_text(
     label = str(num) if num is not None else task.get("id", "")[:8]
     title = (task.get("title") or "").strip() or "(no title)"
     lines = [f"Task {label}: {title}", f"Status: {task.get('status') or 'incomplete'}"]
-    if task.get("priority") is not None:
-        lines.append(f"Priority: {task['priority']}")
-    rec_str = _format_recurrence_short(task.get("recurrence"))
-    if rec_str:
+    if (priority := task.get("priority")) is not None:
+        lines.append(f"Priority: {priority}")
+    if rec_str := _format_recurrence_short(task.get("recurrence")):
         lines.append(f"Recurrence: {rec_str}")
-    if task.get("description"):
-        lines.append(f"Description: {task['description'].strip()}")
-    if task.get("notes"):
-        lines.append(f"Notes: {task['notes'].strip()}")
-    dates_line = _format_task_dates_short(task, tz_name).strip()
-    if dates_line:
+    if description := task.get("description"):
+        lines.append(f"Description: {description.strip()}")
+    if notes := task.get("notes"):
+        lines.append(f"Notes: {notes.strip()}")
+    if dates_line := _format_task_dates_short(task, tz_name).strip():
         lines.append(dates_line)
-    if project_labels:
-        lines.append(f"Projects: {', '.join(project_labels)}")
-    elif task.get("projects"):
-        lines.append(f"Projects: {', '.join(task['projects'])}")
-    if task.get("tags"):
-        lines.append(f"Tags: {', '.join(task['tags'])}")
+    labels = project_labels or task.get("projects")
+    if labels:
+        lines.append(f"Projects: {', '.join(labels)}")
+    if tags := task.get("tags"):
+        lines.append(f"Tags: {', '.join(tags)}")
     if parent_tasks:
-        parent_parts = [f"{t.get('number')} {((t.get('title') or '').strip() or '(no title)')}" for t in parent_tasks if t.get("number") is not None]
-        if not parent_parts:
-            parent_parts = [t.get("id", "")[:8] for t in parent_tasks]
-        lines.append("Depends on (parent tasks): " + ", ".join(parent_parts))
-    if subtasks:
-        sub_parts = [f"{t.get('number')} {((t.get('title') or '').strip() or '(no title)')}" for t in subtasks if t.get("number") is not None]
-        if not sub_parts:
-            sub_parts = [t.get("id", "")[:8] for t in subtasks]
-        lines.append("Subtasks (tasks that depend on this): " + ", ".join(sub_parts))
-    else:
-        lines.append("Subtasks: (none)")
-    if task.get("created_at"):
-        lines.append(f"Created: {_format_datetime_info(task['created_at'], tz_name)}")
-    if task.get("updated_at"):
-        lines.append(f"Updated: {_format_datetime_info(task['updated_at'], tz_name)}")
-    if task.get("completed_at"):
-        lines.append(f"Completed: {_format_datetime_info(task['completed_at'], tz_name)}")
+        lines.append("Depends on (parent tasks): " + _format_task_refs(parent_tasks))
+    lines.append("Subtasks (tasks that depend on this): " + _format_task_refs(subtasks) if subtasks else "Subtasks: (none)")
+    for key, heading in (("created_at", "Created"), ("updated_at", "Updated"), ("completed_at", "Completed")):
+        if stamp := task.get(key):
+            lines.append(f"{heading}: {_format_datetime_info(stamp, tz_name)}")
     return "\n".join(lines)
 
 
@@ -1229,12 +1721,11 @@ def _format_project_info_text(
         f"Project {short_id}: {name}",
         f"Status: {project.get('status') or 'active'}",
     ]
-    if project.get("description"):
-        lines.append(f"Description: {project['description'].strip()}")
-    if project.get("created_at"):
-        lines.append(f"Created: {_format_datetime_info(project['created_at'], tz_name)}")
-    if project.get("updated_at"):
-        lines.append(f"Updated: {_format_datetime_info(project['updated_at'], tz_name)}")
+    if description := project.get("description"):
+        lines.append(f"Description: {description.strip()}")
+    for key, heading in (("created_at", "Created"), ("updated_at", "Updated")):
+        if stamp := project.get(key):
+            lines.append(f"{heading}: {_format_datetime_info(stamp, tz_name)}")
     lines.append("")
     if not tasks_with_subtasks:
         lines.append("Tasks: (none)")
@@ -1247,13 +1738,7 @@ def _format_project_info_text(
         status = task.get("status") or "incomplete"
         date_suffix = _format_task_dates_short(task, tz_name)
         lines.append(f"  {label}. {title} [{status}]{date_suffix}")
-        if subtasks:
-            sub_parts = [f"{t.get('number')} {((t.get('title') or '').strip() or '(no title)')}" for t in subtasks if t.get("number") is not None]
-            if not sub_parts:
-                sub_parts = [t.get("id", "")[:8] for t in subtasks]
-            lines.append("    Subtasks: " + ", ".join(sub_parts))
-        else:
-            lines.append("    (no subtasks)")
+        lines.append("    Subtasks: " + _format_task_refs(subtasks) if subtasks else "    (no subtasks)")
     return "\n".join(lines)
 
 
@@ -1263,12 +1748,13 @@ def _format_project_list_for_telegram(projects: list[dict[str, Any]], max_show:
         return "No projects yet."
     total = len(projects)
     show = projects[:max_show]
-    lines = [f"Projects ({total}):"]
-    for p in show:
-        name = (p.get("name") or "").strip() or "(no name)"
-        short_id = p.get("short_id") or (p.get("id") or "")[:8]
-        status = p.get("status") or "active"
-        lines.append(f"{short_id}. {name} [{status}]")
+    lines = [
+        f"Projects ({total}):",
+        *(
+            f"{p.get('short_id') or (p.get('id') or '')[:8]}. {(p.get('name') or '').strip() or '(no name)'} [{p.get('status') or 'active'}]"
+            for p in show
+        ),
+    ]
     if total > max_show:
         lines.append(f"... and {total - max_show} more.")
     return "\n".join(lines)
@@ -1298,19 +1784,76 @@ def _format_archived_project_list_for_telegram(projects: list[dict[str, Any]], t
     return "\n".join(lines)
 
 
+# user_timezone from config.json, cached briefly: it's needed on most tool calls and loading config parses the file.
+# The TTL keeps the Telegram subprocess in step with changes saved from the web UI.
+_TZ_TTL_SECONDS = 60.0
+_tz_cache: tuple[float, str] | None = None
+_tz_lock = threading.Lock()
+
+
+def _user_timezone() -> str:
+    """User's IANA time zone from config ("UTC" when unset or config can't be loaded)."""
+    global _tz_cache
+    now = time.monotonic()
+    cached = _tz_cache
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    tz_name = "UTC"
+    try:
+        tz_name = getattr(load_config(), "user_timezone", "") or "UTC"
+    except Exception:
+        pass
+    with _tz_lock:
+        _tz_cache = (now + _TZ_TTL_SECONDS, tz_name)
+    return tz_name
+
+
+def clear_user_timezone_cache() -> None:
+    """Drop the cached time zone (call after saving config)."""
+    global _tz_cache
+    with _tz_lock:
+        _tz_cache = None
+
+
 def _format_history(history: list[dict[str, str]]) -> str:
     """Format conversation history for the prompt."""
     if not history:
         return ""
-    lines = []
-    for h in history:
-        role = (h.get("role") or "user").lower()
-        content = (h.get("content") or "").strip()
-        if role == "user":
-            lines.append(f"User: {content}")
-        else:
-            lines.append(f"Assistant: {content}")
-    return "\n".join(lines) + "\n\n"
+    lines = [
+        f"{'User' if (h.get('role') or 'user').lower() == 'user' else 'Assistant'}: {(h.get('content') or '').strip()}"
+        for h in history
+    ]
+    # Two empty entries give the trailing blank line from the same join instead of a second copy of the whole block.
+    lines += ("", "")
+    return "\n".join(lines)
+
+
+def _build_prompt(user_message: str, history: list[dict[str, str]] | None) -> str:
+    """Prompt for chat/tool mode: formatted history plus the current user message (not appended twice when history already ends with it)."""
+    # When history is empty (caller can disable conversation history), only the current user message is sent.
+    history_list = history or []
+    history_block = _format_history(history_list)
+    # Avoid appending user_message twice: caller often passes history that already includes the current message.
+    last_is_current = (
+        len(history_list) > 0
+        and (history_list[-1].get("role") or "user").lower() == "user"
+        and (history_list[-1].get("content") or "").strip() == user_message.strip()
+    )
+    return (history_block + "User: " + user_message).strip() if not last_is_current else history_block.strip()
+
+
+@functools.lru_cache(maxsize=16)
+def _tool_system_prompt(system_prefix: str) -> str:
+    """System prompt for tool mode: the tool orchestrator prompt followed by the caller's prefix (date/time line etc.).
+    The large constant part goes first so it is a byte-identical prefix on every call and Ollama can reuse its cached
+    prompt evaluation; the prefix changes every minute because of the date line."""
+    prefix = system_prefix.strip() if system_prefix else ""
+    return TOOL_ORCHESTRATOR_PROMPT + "\n\n" + prefix if prefix else TOOL_ORCHESTRATOR_PROMPT
+
+
+def _chat_reply(response_text: str) -> str:
+    """Chat mode reply text, with a fallback when the model returned nothing."""
+    return response_text.strip() or "I didn't understand. You can ask me to list or create tasks and projects."
 
 
 def run_orchestrator(
@@ -1328,569 +1871,202 @@ def run_orchestrator(
     tool_used is True when a mutating tool was successfully executed (caller should clear history). For delete_* without confirm, tool_used is False.
     used_fallback is True when the tool was inferred from the user message (quick-add) rather than chosen by the AI.
     """
-    used_fallback = False
     url = f"{ollama_base_url.rstrip('/')}/api/generate"
-    # When history is empty (caller can disable conversation history), only the current user message is sent.
-    history_list = history or []
-    history_block = _format_history(history_list)
-    # Avoid appending user_message twice: caller often passes history that already includes the current message.
-    last_is_current = (
-        len(history_list) > 0
-        and (history_list[-1].get("role") or "user").lower() == "user"
-        and (history_list[-1].get("content") or "").strip() == user_message.strip()
-    )
-    def _prompt_with_user() -> str:
-        return (history_block + "User: " + user_message).strip() if not last_is_current else history_block.strip()
+    prompt = _build_prompt(user_message, history)
+    tool_key = _tool_cache_key(url, model, system_prefix, prompt)
+    cached_call = _tool_cache_get(tool_key) if tool_key else None
+    if cached_call is not None:
+        logger.info("Reusing cached tool call: %s", cached_call[0])
+        return _dispatch_tool_response(user_message, "", response_format, parsed=cached_call)
 
     # Step 1: Classify intent (TOOL vs CHAT)
     try:
-        intent_response = _call_ollama(INTENT_ROUTER_PROMPT, user_message.strip(), url, model)
+        intent_response = _call_ollama(INTENT_ROUTER_PROMPT, user_message.strip(), url, model, fmt="json", options=INTENT_OPTIONS)
         intent = _parse_intent(intent_response)
     except Exception as e:
         logger.exception("Intent router call failed")
-        return (f"Error calling the model: {e}", False, None, used_fallback)
+        return (f"Error calling the model: {e}", False, None, False)
     logger.info("Intent router classified as: %s", intent)
 
     if intent == "CHAT":
         try:
-            chat_prompt = _prompt_with_user()
-            response_text = _call_ollama(CHAT_MODE_PROMPT, chat_prompt, url, model)
+            response_text = _call_ollama(CHAT_MODE_PROMPT, prompt, url, model)
         except Exception as e:
             logger.exception("Chat mode call failed")
-            return (f"Error calling the model: {e}", False, None, used_fallback)
-        text = response_text.strip() or "I didn't understand. You can ask me to list or create tasks and projects."
-        return (text, False, None, used_fallback)
+            return (f"Error calling the model: {e}", False, None, False)
+        return (_chat_reply(response_text), False, None, False)
 
     # Step 2: TOOL — get tool call from orchestrator, then execute
-    full_system = (system_prefix.strip() + "\n\n" + TOOL_ORCHESTRATOR_PROMPT).strip() if system_prefix else TOOL_ORCHESTRATOR_PROMPT
-    tool_prompt = _prompt_with_user()
-    logger.info("Tool mode request prompt_len=%d system_len=%d", len(tool_prompt), len(full_system))
+    full_system = _tool_system_prompt(system_prefix)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Tool mode request prompt_len=%d system_len=%d", len(prompt), len(full_system))
     try:
-        response_text = _call_ollama(full_system, tool_prompt, url, model)
+        response_text = _call_ollama_tool(full_system, prompt, url, model, options=TOOL_OPTIONS)
     except Exception as e:
         logger.exception("Tool orchestrator call failed")
-        return (f"Error calling the model: {e}", False, None, used_fallback)
+        return (f"Error calling the model: {e}", False, None, False)
+    parsed = _parse_tool_call(response_text)
+    if tool_key and parsed:
+        _tool_cache_put(tool_key, parsed)
+    return _dispatch_tool_response(user_message, response_text, response_format, parsed=parsed)
+
+
+async def run_orchestrator_async(
+    user_message: str,
+    ollama_base_url: str,
+    model: str,
+    system_prefix: str,
+    history: list[dict[str, str]] | None = None,
+    response_format: str = "api",
+) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    """Async variant of run_orchestrator (same arguments and return value). Ollama calls go through a pooled httpx.AsyncClient, so callers that already run an event loop can await several messages concurrently."""
+    url = f"{ollama_base_url.rstrip('/')}/api/generate"
+    client = _get_async_client(ollama_base_url)
+    prompt = _build_prompt(user_message, history)
+    tool_key = _tool_cache_key(url, model, system_prefix, prompt)
+    cached_call = _tool_cache_get(tool_key) if tool_key else None
+    if cached_call is not None:
+        logger.info("Reusing cached tool call: %s", cached_call[0])
+        return await asyncio.to_thread(_dispatch_tool_response, user_message, "", response_format, cached_call)
+
+    try:
+        intent_response = await _call_ollama_async(client, INTENT_ROUTER_PROMPT, user_message.strip(), url, model, fmt="json", options=INTENT_OPTIONS)
+        intent = _parse_intent(intent_response)
+    except Exception as e:
+        logger.exception("Intent router call failed")
+        return (f"Error calling the model: {e}", False, None, False)
+    logger.info("Intent router classified as: %s", intent)
+
+    if intent == "CHAT":
+        try:
+            response_text = await _call_ollama_async(client, CHAT_MODE_PROMPT, prompt, url, model)
+        except Exception as e:
+            logger.exception("Chat mode call failed")
+            return (f"Error calling the model: {e}", False, None, False)
+        return (_chat_reply(response_text), False, None, False)
 
+    full_system = _tool_system_prompt(system_prefix)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Tool mode request prompt_len=%d system_len=%d", len(prompt), len(full_system))
+    try:
+        response_text = await _call_ollama_tool_async(client, full_system, prompt, url, model, options=TOOL_OPTIONS)
+    except Exception as e:
+        logger.exception("Tool orchestrator call failed")
+        return (f"Error calling the model: {e}", False, None, False)
     parsed = _parse_tool_call(response_text)
+    if tool_key and parsed:
+        _tool_cache_put(tool_key, parsed)
+    # Tool execution is SQLite work: run it on a worker thread so the event loop keeps serving other messages.
+    return await asyncio.to_thread(_dispatch_tool_response, user_message, response_text, response_format, parsed)
+
+
+async def run_orchestrator_many(
+    messages: list[str],
+    ollama_base_url: str,
+    model: str,
+    system_prefix: str,
+    response_format: str = "api",
+) -> list[tuple[str, bool, dict[str, Any] | None, bool]]:
+    """Run several independent messages (no history) concurrently; results are in the same order as messages. Ollama only overlaps them up to OLLAMA_NUM_PARALLEL (see README)."""
+    return list(await asyncio.gather(*[
+        run_orchestrator_async(m, ollama_base_url, model, system_prefix, history=None, response_format=response_format)
+        for m in messages
+    ]))
+
+
+async def run_orchestrator_batch(
+    messages: list[str],
+    ollama_base_url: str,
+    model: str,
+    system_prefix: str,
+    response_format: str = "api",
+) -> list[tuple[str, bool, dict[str, Any] | None, bool]]:
+    """Bulk task import: every message is a task to create. Skips the intent router and sends all tool-mode requests to Ollama at once. Results are in the same order as messages."""
+    url = f"{ollama_base_url.rstrip('/')}/api/generate"
+    client = _get_async_client(ollama_base_url)
+    full_system = _tool_system_prompt(system_prefix)
+    # Each task is created (on a worker thread) as soon as its response is in, overlapping the DB writes with the
+    # remaining generations, but only after the previous message's turn so task numbers follow message order.
+    turn_done = [asyncio.Event() for _ in messages]
+
+    async def create_one(i: int, message: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+        result: tuple[str, bool, dict[str, Any] | None, bool] | None = None
+        parsed: tuple[str, dict[str, Any]] | None = None
+        used_fallback = False
+        try:
+            response = await _call_ollama_tool_async(client, full_system, _build_prompt(message, None), url, model, options=TOOL_OPTIONS)
+        except Exception as e:
+            logger.exception("Tool orchestrator call failed")
+            result = (f"Error calling the model: {e}", False, None, False)
+        else:
+            parsed = _parse_tool_call(response)
+            if not parsed or parsed[0] != "task_create":
+                parsed = _infer_add_task_from_message(message)
+                used_fallback = parsed is not None
+            if not parsed:
+                result = (f"Could not read a task from: {message}", False, None, False)
+        try:
+            if i:
+                await turn_done[i - 1].wait()
+            if result is None and parsed is not None:
+                result = await asyncio.to_thread(_run_task_create, parsed[1], used_fallback)
+        finally:
+            turn_done[i].set()
+        return result
+
+    return list(await asyncio.gather(*[create_one(i, m) for i, m in enumerate(messages)]))
+
+
+def _dispatch_tool_response(
+    user_message: str,
+    response_text: str,
+    response_format: str = "api",
+    parsed: tuple[str, dict[str, Any]] | None = None,
+) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    """Parse the tool-mode model response (falling back to inferring the tool from user_message) and execute the tool. Same return value as run_orchestrator.
+    parsed: the tool call when the caller already parsed response_text (or took it from the tool-call cache)."""
+    used_fallback = False
+    if parsed is None:
+        parsed = _parse_tool_call(response_text)
     if parsed:
-        logger.info("LLM tool_call parsed name=%s parameters=%s", parsed[0], json.dumps(parsed[1]))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("LLM tool_call parsed name=%s parameters=%s", parsed[0], _dumps(parsed[1]))
     else:
         inferred = _infer_tool_from_user_message(user_message)
         if inferred:
-            logger.info("LLM did not return tool call; inferred from user message: name=%s parameters=%s", inferred[0], json.dumps(inferred[1]))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("LLM did not return tool call; inferred from user message: name=%s parameters=%s", inferred[0], _dumps(inferred[1]))
             parsed = inferred
             used_fallback = True
         else:
             logger.info("LLM response is not a tool call, returning as-is")
     if not parsed:
-        text = response_text.strip() or "I didn't understand. You can ask me to create or list tasks or projects."
-        if _looks_like_json(text):
+        # _looks_like_json skips leading whitespace itself, so the reply is only stripped when it is actually returned.
+        if _looks_like_json(response_text):
             return ("I didn't understand. Try: \"Create a task: [title]\", \"List my tasks\", \"Delete task 1\", \"Create a project: [name]\", \"List my projects\", or \"Delete project 1off\".", False, None, used_fallback)
-        return (text, False, None, used_fallback)
+        return (response_text.strip() or "I didn't understand. You can ask me to create or list tasks or projects.", False, None, used_fallback)
 
     name, params = parsed
-    if name == "project_info":
-        short_id = (params.get("short_id") or params.get("project_id") or "").strip()
-        if not short_id:
-            return ("project_info requires short_id (the project's friendly id, e.g. 1off or work).", False, None, used_fallback)
-        tz_name = "UTC"
-        try:
-            from config import load as load_config
-            tz_name = getattr(load_config(), "user_timezone", "") or "UTC"
-        except Exception:
-            pass
-        try:
-            from project_service import get_project_by_short_id
-            from task_service import list_tasks as svc_list_tasks, get_tasks_that_depend_on
-            project = get_project_by_short_id(short_id)
-        except Exception as e:
-            return (f"Error loading project: {e}", False, None, used_fallback)
-        if not project:
-            return (f"No project with id \"{short_id}\". List projects to see short_ids.", False, None, used_fallback)
-        try:
-            tasks = svc_list_tasks(project_id=project["id"], limit=500)
-            tasks_with_subtasks: list[tuple[dict[str, Any], list[dict[str, Any]]]] = [
-                (t, get_tasks_that_depend_on(t["id"])) for t in tasks
-            ]
-            return (_format_project_info_text(project, tasks_with_subtasks, tz_name), True, None, used_fallback)
-        except Exception as e:
-            return (f"Error loading project tasks: {e}", False, None, used_fallback)
-    if name == "project_list":
-        try:
-            from project_service import list_projects
-            projects = list_projects(status="active")
-        except Exception as e:
-            return (f"Error listing projects: {e}", False, None, used_fallback)
-        return (_format_project_list_for_telegram(projects), True, None, used_fallback)
-    if name == "project_archived":
-        try:
-            from project_service import list_projects
-            projects = list_projects(status="archived")
-        except Exception as e:
-            return (f"Error listing archived projects: {e}", False, None, used_fallback)
-        return (_format_archived_project_list_for_telegram(projects, tz_name), True, None, used_fallback)
-    if name == "project_archive":
-        short_id = (params.get("short_id") or params.get("project_id") or "").strip()
-        if not short_id:
-            return ("project_archive requires short_id (e.g. 1off or work).", False, None, used_fallback)
-        try:
-            from project_service import get_project_by_short_id, update_project
-            project = get_project_by_short_id(short_id)
-        except Exception as e:
-            return (f"Error looking up project: {e}", False, None, used_fallback)
-        if not project:
-            return (f"No project with id \"{short_id}\". List projects to see short_ids.", False, None, used_fallback)
-        if project.get("status") == "archived":
-            return (f"Project {short_id} is already archived.", True, None, used_fallback)
-        if not _parse_confirm(params):
-            name_str = (project.get("name") or "").strip() or short_id
-            return (
-                f"Archive project {short_id} ({name_str})? It will be hidden from the project list until you unarchive it. Reply \"yes\" to confirm.",
-                False,
-                {"tool": "project_archive", "short_id": short_id},
-                used_fallback,
-            )
-        try:
-            update_project(project["id"], status="archived")
-        except ValueError as e:
-            return (str(e), False, None, used_fallback)
-        except Exception as e:
-            return (f"Error archiving project: {e}", False, None, used_fallback)
-        return (f"Project {short_id} archived. It is now hidden from the project list.", True, None, used_fallback)
-    if name == "project_unarchive":
-        short_id = (params.get("short_id") or params.get("project_id") or "").strip()
-        if not short_id:
-            return ("project_unarchive requires short_id (e.g. 1off or work).", False, None, used_fallback)
-        try:
-            from project_service import get_project_by_short_id, update_project
-            project = get_project_by_short_id(short_id)
-        except Exception as e:
-            return (f"Error looking up project: {e}", False, None, used_fallback)
-        if not project:
-            return (f"No project with id \"{short_id}\". List archived projects to see short_ids.", False, None, used_fallback)
-        if project.get("status") != "archived":
-            return (f"Project {short_id} is not archived.", True, None, used_fallback)
-        if not _parse_confirm(params):
-            name_str = (project.get("name") or "").strip() or short_id
-            return (
-                f"Unarchive project {short_id} ({name_str})? It will appear in the project list again. Reply \"yes\" to confirm.",
-                False,
-                {"tool": "project_unarchive", "short_id": short_id},
-                used_fallback,
-            )
-        try:
-            update_project(project["id"], status="active")
-        except Exception as e:
-            return (f"Error unarchiving project: {e}", False, None, used_fallback)
-        return (f"Project {short_id} unarchived. It is back in the project list.", True, None, used_fallback)
-    if name == "project_create":
-        try:
-            validated = _validate_project_create(params)
-        except ValueError as e:
-            return (f"Invalid project_create parameters: {e}", False, None, used_fallback)
-        try:
-            from project_service import create_project
-            project = create_project(
-                name=validated["title"],
-                description=validated.get("description"),
-                status=validated.get("status", "active"),
-            )
-        except Exception as e:
-            return (f"Error creating project: {e}", False, None, used_fallback)
-        return (_format_project_created_for_telegram(project), True, None, used_fallback)
-    if name == "delete_project":
-        short_id = (params.get("short_id") or params.get("project_id") or "").strip()
-        if not short_id:
-            return ("delete_project requires short_id (the project's friendly id, e.g. 1off or work).", False, None, used_fallback)
-        try:
-            from project_service import get_project_by_short_id, delete_project
-            project = get_project_by_short_id(short_id)
-        except Exception as e:
-            return (f"Error looking up project: {e}", False, None, used_fallback)
-        if not project:
-            return (f"No project with id \"{short_id}\". List projects to see short_ids.", False, None, used_fallback)
-        if not _parse_confirm(params):
-            name_str = (project.get("name") or "").strip() or short_id
-            return (
-                f"Delete project {short_id} ({name_str})? It will be removed from all tasks that use it; "
-                "some tasks may end up with no project assignments. Reply \"yes\" to confirm.",
-                False,
-                {"tool": "delete_project", "short_id": short_id},
-                used_fallback,
-            )
-        try:
-            delete_project(project["id"])
-        except Exception as e:
-            return (f"Error deleting project: {e}", False, None, used_fallback)
-        return (f"Project {short_id} deleted. It has been removed from all tasks.", True, None, used_fallback)
-    if name == "delete_task":
-        num = _parse_task_number(params)
-        if num is None:
-            return ("delete_task requires number (the task's friendly id, e.g. 1). List tasks to see numbers.", False, None, used_fallback)
-        try:
-            from task_service import get_task_by_number, delete_task
-            task = get_task_by_number(num)
-        except Exception as e:
-            return (f"Error looking up task: {e}", False, None, used_fallback)
-        if not task:
-            return (f"No task {num}. List tasks to see numbers.", False, None, used_fallback)
-        if not _parse_confirm(params):
-            title = (task.get("title") or "").strip() or "(no title)"
-            return (f"Delete task {num} ({title})? This cannot be undone. Reply \"yes\" to confirm.", False, {"tool": "delete_task", "number": num}, used_fallback)
-        try:
-            delete_task(task["id"])
-        except Exception as e:
-            return (f"Error deleting task: {e}", False, None, used_fallback)
-        return (f"Task {num} deleted.", True, None, used_fallback)
-    if name == "task_info":
-        num = _parse_task_number(params)
-        if num is None:
-            return ("task_info requires number (the task's friendly id, e.g. 1). List tasks to see numbers.", False, None, used_fallback)
-        tz_name = "UTC"
-        try:
-            from config import load as load_config
-            tz_name = getattr(load_config(), "user_timezone", "") or "UTC"
-        except Exception:
-            pass
-        try:
-            from task_service import get_task_by_number, get_task, get_tasks_that_depend_on
-            task = get_task_by_number(num)
-        except Exception as e:
-            return (f"Error loading task: {e}", False, None, used_fallback)
-        if not task:
-            return (f"No task {num}. List tasks to see numbers.", False, None, used_fallback)
-        try:
-            from project_service import get_project
-            parent_tasks: list[dict[str, Any]] = []
-            for dep_id in task.get("depends_on") or []:
-                pt = get_task(dep_id)
-                if pt:
-                    parent_tasks.append(pt)
-            subtasks = get_tasks_that_depend_on(task["id"])
-            project_labels: list[str] = []
-            for pid in task.get("projects") or []:
-                p = get_project(pid)
-                if p:
-                    short_id = (p.get("short_id") or "").strip() or p.get("id", "")[:8]
-                    name = (p.get("name") or "").strip() or "(no name)"
-                    project_labels.append(f"{short_id}: {name}")
-            return (_format_task_info_text(task, parent_tasks, subtasks, project_labels, tz_name), True, None, used_fallback)
-        except Exception as e:
-            return (f"Error loading task details: {e}", False, None, used_fallback)
-    if name == "task_find":
-        tz_name = "UTC"
-        try:
-            from config import load as load_config
-            tz_name = getattr(load_config(), "user_timezone", "") or "UTC"
-        except Exception:
-            pass
-        # List by list_id: run the saved list's query and return tasks (same as app list view)
-        list_id = (params.get("list_id") or params.get("name") or "").strip()
-        if not list_id:
-            extracted = _extract_list_identifier_from_message(user_message)
-            if extracted:
-                list_id = extracted
-        if list_id:
-            try:
-                from list_service import get_list, run_list
-            except Exception as e:
-                return (f"Error loading list service: {e}", False, None, used_fallback)
-            lst = get_list(list_id)
-            if lst:
-                try:
-                    tasks = run_list(list_id, limit=500, tz_name=tz_name)
-                except Exception as e:
-                    return (f"Error running list: {e}", False, None, used_fallback)
-                list_label = (lst.get("name") or "").strip() or list_id
-                short_id = (lst.get("short_id") or "").strip()
-                header = f"List: {list_label} ({short_id})\n" if short_id else f"List: {list_label}\n"
-                fmt = _format_task_list_for_telegram if response_format == "telegram" else _format_task_list_for_api
-                return (header + fmt(tasks, 50, tz_name), True, None, used_fallback)
-            # No list found: try as project short_id (e.g. "tasks in 1off" where 1off is a project)
-            try:
-                from project_service import get_project_by_short_id
-                from task_service import list_tasks as svc_list_tasks
-                project = get_project_by_short_id(list_id)
-            except Exception:
-                project = None
-            if project:
-                try:
-                    tasks = svc_list_tasks(project_id=project["id"], limit=500)
-                except Exception as e:
-                    return (f"Error listing project tasks: {e}", False, None, used_fallback)
-                proj_label = (project.get("name") or "").strip() or list_id
-                header = f"Project {list_id}: {proj_label}\n"
-                fmt = _format_task_list_for_telegram if response_format == "telegram" else _format_task_list_for_api
-                return (header + fmt(tasks, 50, tz_name), True, None, used_fallback)
-            return (f"List \"{list_id}\" not found. Use list_lists to see short_ids.", False, None, used_fallback)
-        merged = dict(params)
-        when = (merged.pop("when", None) or "").strip()
-        term = (merged.get("term") or merged.get("query") or "").strip()
-        merged.pop("term", None)
-        merged.pop("query", None)
-        when_for_date = when
-        if when:
-            when_for_date, extracted_tag = _extract_tag_from_when(when)
-            if extracted_tag and not merged.get("tag") and not merged.get("tags"):
-                merged["tag"] = extracted_tag
-        if when_for_date:
-            when_params = _parse_when_to_task_list_params(when_for_date, tz_name)
-            if not when_params:
-                return (f"Could not parse date from \"{when_for_date}\". Try: due today, due or available today, due tomorrow, due within the next week, available tomorrow, overdue.", False, None, used_fallback)
-            merged.update(when_params)
-            # So "due or available today" isn't narrowed: drop other date filters when we have available_or_due_by
-            if when_params.get("available_or_due_by"):
-                for k in ("due_on", "due_by", "due_before", "available_by", "available_by_required"):
-                    merged.pop(k, None)
-        merged.setdefault("status", "incomplete")
-        try:
-            validated = _validate_task_list_params(merged, tz_name)
-            from task_service import list_tasks as svc_list_tasks
-            tasks = svc_list_tasks(
-                limit=500,
-                status=validated.get("status"),
-                project_id=validated.get("project_id"),
-                project_ids=validated.get("project_ids"),
-                project_mode=validated.get("project_mode") or "any",
-                inbox=validated.get("inbox") or False,
-                tag=validated.get("tag"),
-                tags=validated.get("tags"),
-                tag_mode=validated.get("tag_mode") or "any",
-                due_by=validated.get("due_by"),
-                due_before=validated.get("due_before"),
-                due_on=validated.get("due_on"),
-                available_by=validated.get("available_by"),
-                available_by_required=validated.get("available_by_required") or False,
-                available_or_due_by=validated.get("available_or_due_by"),
-                completed_by=validated.get("completed_by"),
-                completed_after=validated.get("completed_after"),
-                title_contains=validated.get("title_contains"),
-                sort_by=validated.get("sort_by"),
-                flagged=validated.get("flagged"),
-                priority=validated.get("priority"),
-                blocked_by_task_id=validated.get("blocked_by_task_id"),
-                blocking_task_id=validated.get("blocking_task_id"),
-                q=term if term else None,
-            )
-        except Exception as e:
-            return (f"Error listing tasks: {e}", False, None, used_fallback)
-        header = (f"Tasks matching \"{term}\":\n" if term else "")
-        fmt = _format_task_list_for_telegram if response_format == "telegram" else _format_task_list_for_api
-        return (header + fmt(tasks, 50, tz_name), True, None, used_fallback)
-    if name == "list_lists":
-        try:
-            from list_service import list_lists as list_lists_svc
-        except Exception as e:
-            return (f"Error loading list service: {e}", False, None, used_fallback)
-        try:
-            lists = list_lists_svc()
-        except Exception as e:
-            return (f"Error listing lists: {e}", False, None, used_fallback)
-        if not lists:
-            return ("No saved lists yet. Create one via the app or API to view lists here.", True, None, used_fallback)
-        lines = ["Lists:"]
-        for lst in lists:
-            name_part = (lst.get("name") or "").strip() or "(no name)"
-            short = (lst.get("short_id") or "").strip()
-            if short:
-                lines.append(f"• {name_part} ({short})")
-            else:
-                lines.append(f"• {name_part}")
-        return ("\n".join(lines), True, None, used_fallback)
-    if name == "tag_list":
-        try:
-            from task_service import tag_list as svc_tag_list
-            items = svc_tag_list()
-        except Exception as e:
-            return (f"Error listing tags: {e}", False, None, used_fallback)
-        if not items:
-            return ("No tags yet. Tags come from task tags or #tag in task titles/notes.", True, None, used_fallback)
-        lines = ["Tags (task count):"]
-        for item in items:
-            lines.append(f"• {item['tag']}: {item['count']} task(s)")
-        return ("\n".join(lines), True, None, used_fallback)
-    if name == "tag_rename":
-        old_tag = (params.get("old_tag") or "").strip()
-        new_tag = (params.get("new_tag") or "").strip()
-        if not old_tag:
-            return ("tag_rename requires old_tag.", False, None, used_fallback)
-        if not new_tag:
-            return ("tag_rename requires new_tag.", False, None, used_fallback)
-        if old_tag == new_tag:
-            return ("old_tag and new_tag are the same.", True, None, used_fallback)
-        try:
-            from task_service import tag_list
-            tags = tag_list()
-            count = next((x["count"] for x in tags if x["tag"] == old_tag), 0)
-        except Exception:
-            count = 0
-        if not _parse_confirm(params):
-            return (
-                f"Rename tag \"{old_tag}\" to \"{new_tag}\"? This will update task tags and any #{old_tag} in titles/notes ({count} task(s)). Reply \"yes\" to confirm.",
-                False,
-                {"tool": "tag_rename", "old_tag": old_tag, "new_tag": new_tag},
-                used_fallback,
-            )
-        try:
-            from task_service import tag_rename as svc_tag_rename
-            n = svc_tag_rename(old_tag, new_tag)
-            return (f"Tag \"{old_tag}\" renamed to \"{new_tag}\". Updated {n} task(s).", True, None, used_fallback)
-        except ValueError as e:
-            return (str(e), False, None, used_fallback)
-        except Exception as e:
-            return (f"Error renaming tag: {e}", False, None, used_fallback)
-    if name == "tag_delete":
-        tag = (params.get("tag") or "").strip()
-        if not tag:
-            return ("tag_delete requires tag.", False, None, used_fallback)
-        try:
-            from task_service import tag_list
-            tags = tag_list()
-            count = next((x["count"] for x in tags if x["tag"] == tag), 0)
-        except Exception:
-            count = 0
-        if not _parse_confirm(params):
-            return (
-                f"Delete tag \"{tag}\"? It will be removed from all task tags and any #{tag} in titles/notes ({count} task(s)). Reply \"yes\" to confirm.",
-                False,
-                {"tool": "tag_delete", "tag": tag},
-                used_fallback,
-            )
-        try:
-            from task_service import tag_delete as svc_tag_delete
-            svc_tag_delete(tag)
-            return (f"Tag \"{tag}\" removed from all tasks.", True, None, used_fallback)
-        except ValueError as e:
-            return (str(e), False, None, used_fallback)
-        except Exception as e:
-            return (f"Error deleting tag: {e}", False, None, used_fallback)
-    if name == "task_update":
-        tz_name = "UTC"
-        try:
-            from config import load as load_config
-            tz_name = getattr(load_config(), "user_timezone", "") or "UTC"
-        except Exception:
-            pass
-        try:
-            validated = _validate_task_update(params, tz_name)
-        except ValueError as e:
-            return (str(e), False, None, used_fallback)
-        from date_utils import resolve_task_dates
-        validated = resolve_task_dates(validated, tz_name)
-        num = validated.pop("number")
-        try:
-            from task_service import get_task_by_number, update_task, complete_recurring_task, remove_task_project, add_task_project, remove_task_tag, add_task_tag
-            task = get_task_by_number(num)
-        except Exception as e:
-            return (f"Error looking up task: {e}", False, None, used_fallback)
-        if not task:
-            return (f"No task {num}. List tasks to see numbers.", False, None, used_fallback)
-        task_id = task["id"]
-        scalar_keys = ("status", "flagged", "due_date", "available_date", "title", "description", "notes", "priority")
-        kwargs = {k: v for k, v in validated.items() if k in scalar_keys and v is not None}
-        has_projects = "projects" in validated
-        has_remove_projects = "remove_projects" in validated and validated["remove_projects"]
-        has_tags = "tags" in validated
-        if not kwargs and not has_projects and not has_remove_projects and not has_tags:
-            return ("Nothing to update. Specify status, flagged, due_date, available_date, title, description, notes, priority, projects, remove_projects, or tags.", False, None, used_fallback)
-        # When marking a recurring task complete, create next instance and mark current complete
-        if kwargs.get("status") == "complete" and task.get("recurrence"):
-            try:
-                complete_recurring_task(task_id)
-            except Exception as e:
-                return (f"Error completing recurring task: {e}", False, None, used_fallback)
-            kwargs = {k: v for k, v in kwargs.items() if k != "status"}
-        if kwargs:
-            try:
-                updated = update_task(task_id, **kwargs)
-            except Exception as e:
-                return (f"Error updating task: {e}", False, None, used_fallback)
-            if not updated:
-                return (f"Task {num} not found.", False, None, used_fallback)
-        if has_projects:
-            try:
-                from project_service import get_project_by_short_id
-                for pid in task.get("projects") or []:
-                    remove_task_project(task_id, pid)
-                for ref in validated["projects"]:
-                    if not ref:
-                        continue
-                    p = get_project_by_short_id(ref)
-                    project_id = p["id"] if p else ref
-                    add_task_project(task_id, str(project_id))
-            except Exception as e:
-                return (f"Error updating task projects: {e}", False, None, used_fallback)
-        elif has_remove_projects:
-            try:
-                from project_service import get_project_by_short_id
-                current_ids = list(task.get("projects") or [])
-                to_remove_ids = set()
-                for ref in validated["remove_projects"]:
-                    if not ref:
-                        continue
-                    p = get_project_by_short_id(ref)
-                    pid = p["id"] if p else ref
-                    to_remove_ids.add(str(pid))
-                new_ids = [pid for pid in current_ids if str(pid) not in to_remove_ids]
-                for pid in task.get("projects") or []:
-                    remove_task_project(task_id, pid)
-                for pid in new_ids:
-                    add_task_project(task_id, str(pid))
-            except Exception as e:
-                return (f"Error removing task from project(s): {e}", False, None, used_fallback)
-        if has_tags:
-            try:
-                for tag in task.get("tags") or []:
-                    remove_task_tag(task_id, tag)
-                for tag in validated["tags"]:
-                    if tag:
-                        add_task_tag(task_id, tag)
-            except Exception as e:
-                return (f"Error updating task tags: {e}", False, None, used_fallback)
-        parts = []
-        if "status" in kwargs:
-            parts.append("complete" if kwargs["status"] == "complete" else "reopened")
-        if "flagged" in kwargs:
-            parts.append("flagged" if kwargs["flagged"] else "unflagged")
-        if "due_date" in kwargs:
-            parts.append(f"due {kwargs['due_date']}")
-        if "available_date" in kwargs:
-            parts.append(f"available {kwargs['available_date']}")
-        if "title" in kwargs:
-            parts.append("title updated")
-        if "description" in kwargs or "notes" in kwargs or "priority" in kwargs:
-            parts.append("updated")
-        if has_projects:
-            parts.append("projects updated")
-        if has_remove_projects:
-            parts.append("removed from project(s)")
-        if has_tags:
-            parts.append("tags updated")
-        msg = f"Task {num} " + (", ".join(parts) if parts else "updated") + "."
-        return (msg, True, None, used_fallback)
-    if name != "task_create":
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         fallback = f"Tool '{name}' is not implemented yet. You can create, list, info, update, or delete tasks and projects."
-        text = response_text.strip() or fallback
-        return (fallback if _looks_like_json(text) else text, False, None, used_fallback)
+        return (fallback if _looks_like_json(response_text) else response_text.strip() or fallback, False, None, used_fallback)
+    return handler(params, used_fallback, user_message, response_format)
+
 
+def _run_task_create(params: dict[str, Any], used_fallback: bool = False) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    """Validate task_create parameters, resolve dates and project short_ids, and create the task. Same return value as run_orchestrator."""
     try:
         validated = _validate_task_create(params)
     except ValueError as e:
         return (f"Invalid task_create parameters: {e}", False, None, used_fallback)
 
-    tz_name = "UTC"
-    try:
-        from config import load as load_config
-        tz_name = getattr(load_config(), "user_timezone", "") or "UTC"
-    except Exception:
-        pass
-    from date_utils import resolve_task_dates
+    tz_name = _user_timezone()
     validated = resolve_task_dates(validated, tz_name)
 
     project_ids = None
     if validated.get("projects"):
         try:
-            from project_service import get_project_by_short_id
             project_ids = []
             for ref in validated["projects"]:
                 ref = str(ref).strip()
@@ -1904,7 +2080,6 @@ def run_orchestrator(
             project_ids = None
 
     try:
-        from task_service import create_task as svc_create_task
         task = svc_create_task(
             title=validated["title"],
             description=validated.get("description"),
@@ -1921,3 +2096,490 @@ def run_orchestrator(
         return (f"Error creating task: {e}", False, None, used_fallback)
 
     return (_format_task_created_for_telegram(task, tz_name), True, None, used_fallback)
+
+
+def _handle_project_info(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    short_id = (params.get("short_id") or params.get("project_id") or "").strip()
+    if not short_id:
+        return ("project_info requires short_id (the project's friendly id, e.g. 1off or work).", False, None, used_fallback)
+    tz_name = _user_timezone()
+    try:
+        project = get_project_by_short_id_cached(short_id)
+    except Exception as e:
+        return (f"Error loading project: {e}", False, None, used_fallback)
+    if not project:
+        return (f"No project with id \"{short_id}\". List projects to see short_ids.", False, None, used_fallback)
+    try:
+        with connection() as conn:
+            tasks = svc_list_tasks(project_id=project["id"], limit=500, fields=_TASK_LIST_FIELDS, conn=conn)
+            subtasks_by_id = get_tasks_that_depend_on_bulk([t["id"] for t in tasks], conn=conn)
+        tasks_with_subtasks: list[tuple[dict[str, Any], list[dict[str, Any]]]] = [
+            (t, subtasks_by_id.get(t["id"], [])) for t in tasks
+        ]
+        return (_format_project_info_text(project, tasks_with_subtasks, tz_name), True, None, used_fallback)
+    except Exception as e:
+        return (f"Error loading project tasks: {e}", False, None, used_fallback)
+
+
+def _handle_project_list(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    try:
+        projects = list_projects(status="active", fields=_PROJECT_LIST_FIELDS)
+    except Exception as e:
+        return (f"Error listing projects: {e}", False, None, used_fallback)
+    return (_format_project_list_for_telegram(projects), True, None, used_fallback)
+
+
+def _handle_project_archived(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    try:
+        projects = list_projects(status="archived", fields=_PROJECT_LIST_FIELDS)
+    except Exception as e:
+        return (f"Error listing archived projects: {e}", False, None, used_fallback)
+    return (_format_archived_project_list_for_telegram(projects, _user_timezone()), True, None, used_fallback)
+
+
+def _handle_project_archive(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    short_id = (params.get("short_id") or params.get("project_id") or "").strip()
+    if not short_id:
+        return ("project_archive requires short_id (e.g. 1off or work).", False, None, used_fallback)
+    try:
+        project = get_project_by_short_id(short_id)
+    except Exception as e:
+        return (f"Error looking up project: {e}", False, None, used_fallback)
+    if not project:
+        return (f"No project with id \"{short_id}\". List projects to see short_ids.", False, None, used_fallback)
+    if project.get("status") == "archived":
+        return (f"Project {short_id} is already archived.", True, None, used_fallback)
+    if not _parse_confirm(params):
+        name_str = (project.get("name") or "").strip() or short_id
+        return (
+            f"Archive project {short_id} ({name_str})? It will be hidden from the project list until you unarchive it. Reply \"yes\" to confirm.",
+            False,
+            {"tool": "project_archive", "short_id": short_id},
+            used_fallback,
+        )
+    try:
+        update_project(project["id"], status="archived")
+    except ValueError as e:
+        return (str(e), False, None, used_fallback)
+    except Exception as e:
+        return (f"Error archiving project: {e}", False, None, used_fallback)
+    return (f"Project {short_id} archived. It is now hidden from the project list.", True, None, used_fallback)
+
+
+def _handle_project_unarchive(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    short_id = (params.get("short_id") or params.get("project_id") or "").strip()
+    if not short_id:
+        return ("project_unarchive requires short_id (e.g. 1off or work).", False, None, used_fallback)
+    try:
+        project = get_project_by_short_id(short_id)
+    except Exception as e:
+        return (f"Error looking up project: {e}", False, None, used_fallback)
+    if not project:
+        return (f"No project with id \"{short_id}\". List archived projects to see short_ids.", False, None, used_fallback)
+    if project.get("status") != "archived":
+        return (f"Project {short_id} is not archived.", True, None, used_fallback)
+    if not _parse_confirm(params):
+        name_str = (project.get("name") or "").strip() or short_id
+        return (
+            f"Unarchive project {short_id} ({name_str})? It will appear in the project list again. Reply \"yes\" to confirm.",
+            False,
+            {"tool": "project_unarchive", "short_id": short_id},
+            used_fallback,
+        )
+    try:
+        update_project(project["id"], status="active")
+    except Exception as e:
+        return (f"Error unarchiving project: {e}", False, None, used_fallback)
+    return (f"Project {short_id} unarchived. It is back in the project list.", True, None, used_fallback)
+
+
+def _handle_project_create(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    try:
+        validated = _validate_project_create(params)
+    except ValueError as e:
+        return (f"Invalid project_create parameters: {e}", False, None, used_fallback)
+    try:
+        project = create_project(
+            name=validated["title"],
+            description=validated.get("description"),
+            status=validated.get("status", "active"),
+        )
+    except Exception as e:
+        return (f"Error creating project: {e}", False, None, used_fallback)
+    return (_format_project_created_for_telegram(project), True, None, used_fallback)
+
+
+def _handle_delete_project(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    short_id = (params.get("short_id") or params.get("project_id") or "").strip()
+    if not short_id:
+        return ("delete_project requires short_id (the project's friendly id, e.g. 1off or work).", False, None, used_fallback)
+    try:
+        project = get_project_by_short_id(short_id)
+    except Exception as e:
+        return (f"Error looking up project: {e}", False, None, used_fallback)
+    if not project:
+        return (f"No project with id \"{short_id}\". List projects to see short_ids.", False, None, used_fallback)
+    if not _parse_confirm(params):
+        name_str = (project.get("name") or "").strip() or short_id
+        return (
+            f"Delete project {short_id} ({name_str})? It will be removed from all tasks that use it; "
+            "some tasks may end up with no project assignments. Reply \"yes\" to confirm.",
+            False,
+            {"tool": "delete_project", "short_id": short_id},
+            used_fallback,
+        )
+    try:
+        delete_project(project["id"])
+    except Exception as e:
+        return (f"Error deleting project: {e}", False, None, used_fallback)
+    return (f"Project {short_id} deleted. It has been removed from all tasks.", True, None, used_fallback)
+
+
+def _handle_delete_task(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    num = _parse_task_number(params)
+    if num is None:
+        return ("delete_task requires number (the task's friendly id, e.g. 1). List tasks to see numbers.", False, None, used_fallback)
+    try:
+        task = get_task_by_number(num)
+    except Exception as e:
+        return (f"Error looking up task: {e}", False, None, used_fallback)
+    if not task:
+        return (f"No task {num}. List tasks to see numbers.", False, None, used_fallback)
+    if not _parse_confirm(params):
+        title = (task.get("title") or "").strip() or "(no title)"
+        return (f"Delete task {num} ({title})? This cannot be undone. Reply \"yes\" to confirm.", False, {"tool": "delete_task", "number": num}, used_fallback)
+    try:
+        delete_task(task["id"])
+    except Exception as e:
+        return (f"Error deleting task: {e}", False, None, used_fallback)
+    return (f"Task {num} deleted.", True, None, used_fallback)
+
+
+def _handle_task_info(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    num = _parse_task_number(params)
+    if num is None:
+        return ("task_info requires number (the task's friendly id, e.g. 1). List tasks to see numbers.", False, None, used_fallback)
+    tz_name = _user_timezone()
+    # One connection for the task, its parents, subtasks and projects.
+    try:
+        conn = get_connection()
+    except Exception as e:
+        return (f"Error loading task: {e}", False, None, used_fallback)
+    try:
+        try:
+            task = get_task_by_number(num, conn=conn)
+        except Exception as e:
+            return (f"Error loading task: {e}", False, None, used_fallback)
+        if not task:
+            return (f"No task {num}. List tasks to see numbers.", False, None, used_fallback)
+        try:
+            parent_tasks = get_tasks(task.get("depends_on") or [], conn=conn)
+            subtasks = get_tasks_that_depend_on(task["id"], conn=conn)
+            project_labels = [
+                f"{(p.get('short_id') or '').strip() or p.get('id', '')[:8]}: {(p.get('name') or '').strip() or '(no name)'}"
+                for p in get_projects_cached(task.get("projects") or [], conn=conn)
+            ]
+            return (_format_task_info_text(task, parent_tasks, subtasks, project_labels, tz_name), True, None, used_fallback)
+        except Exception as e:
+            return (f"Error loading task details: {e}", False, None, used_fallback)
+    finally:
+        conn.close()
+
+
+def _handle_task_find(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    tz_name = _user_timezone()
+    # List by list_id: run the saved list's query and return tasks (same as app list view)
+    list_id = (params.get("list_id") or params.get("name") or "").strip()
+    if not list_id:
+        extracted = _extract_list_identifier_from_message(user_message)
+        if extracted:
+            list_id = extracted
+    if list_id:
+        lst = get_list(list_id)
+        if lst:
+            try:
+                tasks = run_list(list_id, limit=500, tz_name=tz_name)
+            except Exception as e:
+                return (f"Error running list: {e}", False, None, used_fallback)
+            list_label = (lst.get("name") or "").strip() or list_id
+            short_id = (lst.get("short_id") or "").strip()
+            header = f"List: {list_label} ({short_id})\n" if short_id else f"List: {list_label}\n"
+            fmt = _format_task_list_for_telegram if response_format == "telegram" else _format_task_list_for_api
+            return (header + fmt(tasks, 50, tz_name), True, None, used_fallback)
+        # No list found: try as project short_id (e.g. "tasks in 1off" where 1off is a project)
+        try:
+            project = get_project_by_short_id_cached(list_id)
+        except Exception:
+            project = None
+        if project:
+            try:
+                tasks = svc_list_tasks(project_id=project["id"], limit=500, fields=_TASK_LIST_FIELDS)
+            except Exception as e:
+                return (f"Error listing project tasks: {e}", False, None, used_fallback)
+            proj_label = (project.get("name") or "").strip() or list_id
+            header = f"Project {list_id}: {proj_label}\n"
+            fmt = _format_task_list_for_telegram if response_format == "telegram" else _format_task_list_for_api
+            return (header + fmt(tasks, 50, tz_name), True, None, used_fallback)
+        return (f"List \"{list_id}\" not found. Use list_lists to see short_ids.", False, None, used_fallback)
+    merged = dict(params)
+    when = (merged.pop("when", None) or "").strip()
+    term = (merged.get("term") or merged.get("query") or "").strip()
+    merged.pop("term", None)
+    merged.pop("query", None)
+    when_for_date = when
+    if when:
+        when_for_date, extracted_tag = _extract_tag_from_when(when)
+        if extracted_tag and not merged.get("tag") and not merged.get("tags"):
+            merged["tag"] = extracted_tag
+    if when_for_date:
+        when_params = _parse_when_to_task_list_params(when_for_date, tz_name)
+        if not when_params:
+            return (f"Could not parse date from \"{when_for_date}\". Try: due today, due or available today, due tomorrow, due within the next week, available tomorrow, overdue.", False, None, used_fallback)
+        merged.update(when_params)
+        # So "due or available today" isn't narrowed: drop other date filters when we have available_or_due_by
+        if when_params.get("available_or_due_by"):
+            for k in ("due_on", "due_by", "due_before", "available_by", "available_by_required"):
+                merged.pop(k, None)
+    merged.setdefault("status", "incomplete")
+    try:
+        validated = _validate_task_list_params(merged, tz_name)
+        tasks = svc_list_tasks(
+            limit=500,
+            fields=_TASK_LIST_FIELDS,
+            status=validated.get("status"),
+            project_id=validated.get("project_id"),
+            project_ids=validated.get("project_ids"),
+            project_mode=validated.get("project_mode") or "any",
+            inbox=validated.get("inbox") or False,
+            tag=validated.get("tag"),
+            tags=validated.get("tags"),
+            tag_mode=validated.get("tag_mode") or "any",
+            due_by=validated.get("due_by"),
+            due_before=validated.get("due_before"),
+            due_on=validated.get("due_on"),
+            available_by=validated.get("available_by"),
+            available_by_required=validated.get("available_by_required") or False,
+            available_or_due_by=validated.get("available_or_due_by"),
+            completed_by=validated.get("completed_by"),
+            completed_after=validated.get("completed_after"),
+            title_contains=validated.get("title_contains"),
+            sort_by=validated.get("sort_by"),
+            flagged=validated.get("flagged"),
+            priority=validated.get("priority"),
+            blocked_by_task_id=validated.get("blocked_by_task_id"),
+            blocking_task_id=validated.get("blocking_task_id"),
+            q=term if term else None,
+        )
+    except Exception as e:
+        return (f"Error listing tasks: {e}", False, None, used_fallback)
+    header = (f"Tasks matching \"{term}\":\n" if term else "")
+    fmt = _format_task_list_for_telegram if response_format == "telegram" else _format_task_list_for_api
+    return (header + fmt(tasks, 50, tz_name), True, None, used_fallback)
+
+
+def _handle_list_lists(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    try:
+        lists = list_lists_svc()
+    except Exception as e:
+        return (f"Error listing lists: {e}", False, None, used_fallback)
+    if not lists:
+        return ("No saved lists yet. Create one via the app or API to view lists here.", True, None, used_fallback)
+    lines = ["Lists:"]
+    for lst in lists:
+        name_part = (lst.get("name") or "").strip() or "(no name)"
+        short = (lst.get("short_id") or "").strip()
+        if short:
+            lines.append(f"• {name_part} ({short})")
+        else:
+            lines.append(f"• {name_part}")
+    return ("\n".join(lines), True, None, used_fallback)
+
+
+def _handle_tag_list(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    try:
+        items = svc_tag_list()
+    except Exception as e:
+        return (f"Error listing tags: {e}", False, None, used_fallback)
+    if not items:
+        return ("No tags yet. Tags come from task tags or #tag in task titles/notes.", True, None, used_fallback)
+    lines = ["Tags (task count):"]
+    for item in items:
+        lines.append(f"• {item['tag']}: {item['count']} task(s)")
+    return ("\n".join(lines), True, None, used_fallback)
+
+
+def _handle_tag_rename(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    old_tag = (params.get("old_tag") or "").strip()
+    new_tag = (params.get("new_tag") or "").strip()
+    if not old_tag:
+        return ("tag_rename requires old_tag.", False, None, used_fallback)
+    if not new_tag:
+        return ("tag_rename requires new_tag.", False, None, used_fallback)
+    if old_tag == new_tag:
+        return ("old_tag and new_tag are the same.", True, None, used_fallback)
+    try:
+        tags = svc_tag_list()
+        count = next((x["count"] for x in tags if x["tag"] == old_tag), 0)
+    except Exception:
+        count = 0
+    if not _parse_confirm(params):
+        return (
+            f"Rename tag \"{old_tag}\" to \"{new_tag}\"? This will update task tags and any #{old_tag} in titles/notes ({count} task(s)). Reply \"yes\" to confirm.",
+            False,
+            {"tool": "tag_rename", "old_tag": old_tag, "new_tag": new_tag},
+            used_fallback,
+        )
+    try:
+        n = svc_tag_rename(old_tag, new_tag)
+        return (f"Tag \"{old_tag}\" renamed to \"{new_tag}\". Updated {n} task(s).", True, None, used_fallback)
+    except ValueError as e:
+        return (str(e), False, None, used_fallback)
+    except Exception as e:
+        return (f"Error renaming tag: {e}", False, None, used_fallback)
+
+
+def _handle_tag_delete(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    tag = (params.get("tag") or "").strip()
+    if not tag:
+        return ("tag_delete requires tag.", False, None, used_fallback)
+    try:
+        tags = svc_tag_list()
+        count = next((x["count"] for x in tags if x["tag"] == tag), 0)
+    except Exception:
+        count = 0
+    if not _parse_confirm(params):
+        return (
+            f"Delete tag \"{tag}\"? It will be removed from all task tags and any #{tag} in titles/notes ({count} task(s)). Reply \"yes\" to confirm.",
+            False,
+            {"tool": "tag_delete", "tag": tag},
+            used_fallback,
+        )
+    try:
+        svc_tag_delete(tag)
+        return (f"Tag \"{tag}\" removed from all tasks.", True, None, used_fallback)
+    except ValueError as e:
+        return (str(e), False, None, used_fallback)
+    except Exception as e:
+        return (f"Error deleting tag: {e}", False, None, used_fallback)
+
+
+def _handle_task_update(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    tz_name = _user_timezone()
+    try:
+        validated = _validate_task_update(params, tz_name)
+    except ValueError as e:
+        return (str(e), False, None, used_fallback)
+    validated = resolve_task_dates(validated, tz_name)
+    num = validated.pop("number")
+    try:
+        task = get_task_by_number(num)
+    except Exception as e:
+        return (f"Error looking up task: {e}", False, None, used_fallback)
+    if not task:
+        return (f"No task {num}. List tasks to see numbers.", False, None, used_fallback)
+    task_id = task["id"]
+    scalar_keys = ("status", "flagged", "due_date", "available_date", "title", "description", "notes", "priority")
+    kwargs = {k: v for k, v in validated.items() if k in scalar_keys and v is not None}
+    has_projects = "projects" in validated
+    has_remove_projects = "remove_projects" in validated and validated["remove_projects"]
+    has_tags = "tags" in validated
+    if not kwargs and not has_projects and not has_remove_projects and not has_tags:
+        return ("Nothing to update. Specify status, flagged, due_date, available_date, title, description, notes, priority, projects, remove_projects, or tags.", False, None, used_fallback)
+    # When marking a recurring task complete, create next instance and mark current complete
+    if kwargs.get("status") == "complete" and task.get("recurrence"):
+        try:
+            complete_recurring_task(task_id)
+        except Exception as e:
+            return (f"Error completing recurring task: {e}", False, None, used_fallback)
+        kwargs = {k: v for k, v in kwargs.items() if k != "status"}
+    if kwargs:
+        try:
+            updated = update_task(task_id, **kwargs)
+        except Exception as e:
+            return (f"Error updating task: {e}", False, None, used_fallback)
+        if not updated:
+            return (f"Task {num} not found.", False, None, used_fallback)
+    if has_projects:
+        try:
+            for pid in task.get("projects") or []:
+                remove_task_project(task_id, pid)
+            for ref in validated["projects"]:
+                if not ref:
+                    continue
+                p = get_project_by_short_id(ref)
+                project_id = p["id"] if p else ref
+                add_task_project(task_id, str(project_id))
+        except Exception as e:
+            return (f"Error updating task projects: {e}", False, None, used_fallback)
+    elif has_remove_projects:
+        try:
+            current_ids = list(task.get("projects") or [])
+            to_remove_ids = set()
+            for ref in validated["remove_projects"]:
+                if not ref:
+                    continue
+                p = get_project_by_short_id(ref)
+                pid = p["id"] if p else ref
+                to_remove_ids.add(str(pid))
+            new_ids = [pid for pid in current_ids if str(pid) not in to_remove_ids]
+            for pid in task.get("projects") or []:
+                remove_task_project(task_id, pid)
+            for pid in new_ids:
+                add_task_project(task_id, str(pid))
+        except Exception as e:
+            return (f"Error removing task from project(s): {e}", False, None, used_fallback)
+    if has_tags:
+        try:
+            for tag in task.get("tags") or []:
+                remove_task_tag(task_id, tag)
+            for tag in validated["tags"]:
+                if tag:
+                    add_task_tag(task_id, tag)
+        except Exception as e:
+            return (f"Error updating task tags: {e}", False, None, used_fallback)
+    parts = []
+    if "status" in kwargs:
+        parts.append("complete" if kwargs["status"] == "complete" else "reopened")
+    if "flagged" in kwargs:
+        parts.append("flagged" if kwargs["flagged"] else "unflagged")
+    if "due_date" in kwargs:
+        parts.append(f"due {kwargs['due_date']}")
+    if "available_date" in kwargs:
+        parts.append(f"available {kwargs['available_date']}")
+    if "title" in kwargs:
+        parts.append("title updated")
+    if "description" in kwargs or "notes" in kwargs or "priority" in kwargs:
+        parts.append("updated")
+    if has_projects:
+        parts.append("projects updated")
+    if has_remove_projects:
+        parts.append("removed from project(s)")
+    if has_tags:
+        parts.append("tags updated")
+    msg = f"Task {num} " + (", ".join(parts) if parts else "updated") + "."
+    return (msg, True, None, used_fallback)
+
+
+def _handle_task_create(params: dict[str, Any], used_fallback: bool, user_message: str, response_format: str) -> tuple[str, bool, dict[str, Any] | None, bool]:
+    return _run_task_create(params, used_fallback)
+
+
+# Tool name -> handler(params, used_fallback, user_message, response_format); same return value as run_orchestrator.
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any], bool, str, str], tuple[str, bool, dict[str, Any] | None, bool]]] = {
+    "project_info": _handle_project_info,
+    "project_list": _handle_project_list,
+    "project_archived": _handle_project_archived,
+    "project_archive": _handle_project_archive,
+    "project_unarchive": _handle_project_unarchive,
+    "project_create": _handle_project_create,
+    "delete_project": _handle_delete_project,
+    "delete_task": _handle_delete_task,
+    "task_info": _handle_task_info,
+    "task_find": _handle_task_find,
+    "list_lists": _handle_list_lists,
+    "tag_list": _handle_tag_list,
+    "tag_rename": _handle_tag_rename,
+    "tag_delete": _handle_tag_delete,
+    "task_update": _handle_task_update,
+    "task_create": _handle_task_create,
+}
@@ -3,10 +3,10 @@ Project service: CRUD for projects. short_id is a unique 1–4 alphanumeric user
 """
 from __future__ import annotations
 
-import re
 import sqlite3
+import threading
+import time
 import uuid
-from datetime import datetime, timezone
 from typing import Any
 
 try:
@@ -17,19 +17,24 @@ except ImportError:
     def _new_id() -> str:
         return str(uuid.uuid4())
 
-from database import get_connection, init_database
+from database import IN_CHUNK, connection, get_connection, init_database, now_iso as _now_iso
 
 PROJECT_STATUSES = frozenset({"active", "archived"})
 SHORT_ID_MAX_LEN = 4
-
-
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+PROJECT_COLUMNS = ("id", "short_id", "name", "description", "created_at", "updated_at", "status")
+_ASCII_LOWER = "abcdefghijklmnopqrstuvwxyz"
+# Shared by the single-row lookups; the WHERE clauses below are constant strings, so sqlite3's statement cache reuses them.
+_SELECT_PROJECT = f"SELECT {', '.join(PROJECT_COLUMNS)} FROM projects"
+_SELECT_PROJECT_BY_ID = _SELECT_PROJECT + " WHERE id = ?"
+_SELECT_PROJECT_BY_SHORT_ID = _SELECT_PROJECT + " WHERE short_id = ?"
+# Every ASCII byte except a-z and 0-9, for bytes.translate deletion in _alphanumeric.
+_NON_ALNUM_BYTES = bytes(b for b in range(128) if chr(b) not in _ASCII_LOWER + "0123456789")
 
 
 def _alphanumeric(s: str) -> str:
     """Lowercase alphanumeric only."""
-    return re.sub(r"[^a-z0-9]", "", s.lower())
+    # Non-ASCII characters can never match [a-z0-9], so drop them while encoding, then delete the rest in one C pass.
+    return s.lower().encode("ascii", "ignore").translate(None, _NON_ALNUM_BYTES).decode("ascii")
 
 
 def _default_short_id_candidate(name: str) -> str:
@@ -53,16 +58,16 @@ def _find_available_short_id(conn: sqlite3.Connection, name: str) -> str:
     base = _alphanumeric(name)[:3]
     if not base:
         base = "p"
-    for c in "abcdefghijklmnopqrstuvwxyz":
+    # Every candidate below starts with base[:2] (alphanumeric, so no LIKE wildcards): load those short_ids once.
+    taken = {r[0] for r in conn.execute("SELECT short_id FROM projects WHERE short_id LIKE ?", (base[:2] + "%",))}
+    for c in _ASCII_LOWER:
         short = (base + c)[:SHORT_ID_MAX_LEN]
-        row = conn.execute("SELECT 1 FROM projects WHERE short_id = ?", (short,)).fetchone()
-        if not row:
+        if short not in taken:
             return short
-    for c1 in "abcdefghijklmnopqrstuvwxyz":
-        for c2 in "abcdefghijklmnopqrstuvwxyz":
+    for c1 in _ASCII_LOWER:
+        for c2 in _ASCII_LOWER:
             short = (base[:2] + c1 + c2)[:SHORT_ID_MAX_LEN]
-            row = conn.execute("SELECT 1 FROM projects WHERE short_id = ?", (short,)).fetchone()
-            if not row:
+            if short not in taken:
                 return short
     raise ValueError("Could not generate unique short_id")
 
@@ -82,22 +87,32 @@ def create_project(
     conn = get_connection()
     try:
         short_id = _find_available_short_id(conn, name)
+        row = (pid, short_id, name.strip(), description.strip() if description else None, now, now, status)
         conn.execute(
             """INSERT INTO projects (id, short_id, name, description, created_at, updated_at, status)
                VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (pid, short_id, name.strip(), description.strip() if description else None, now, now, status),
+            row,
         )
         conn.commit()
-        return get_project(pid)
+        _clear_project_caches()
+        # Every column was just written, so build the dict rather than reading the row back.
+        return dict(zip(PROJECT_COLUMNS, row))
     finally:
         conn.close()
 
 
-def list_projects(status: str | None = None) -> list[dict[str, Any]]:
-    """List projects, optionally filtered by status (active | archived)."""
+def list_projects(status: str | None = None, fields: list[str] | None = None) -> list[dict[str, Any]]:
+    """List projects, optionally filtered by status (active | archived). fields: only select these PROJECT_COLUMNS."""
+    if fields:
+        unknown = set(fields) - set(PROJECT_COLUMNS)
+        if unknown:
+            raise ValueError(f"unknown project fields: {sorted(unknown)}")
+        columns = ", ".join(dict.fromkeys(fields))
+    else:
+        columns = ", ".join(PROJECT_COLUMNS)
     conn = get_connection()
     try:
-        sql = "SELECT id, short_id, name, description, created_at, updated_at, status FROM projects WHERE 1=1"
+        sql = f"SELECT {columns} FROM projects WHERE 1=1"
         params: list[Any] = []
         if status:
             if status not in PROJECT_STATUSES:
@@ -114,44 +129,106 @@ def list_projects(status: str | None = None) -> list[dict[str, Any]]:
         conn.close()
 
 
-def get_project(project_id: str) -> dict[str, Any] | None:
+def get_project(project_id: str, conn: sqlite3.Connection | None = None) -> dict[str, Any] | None:
     """Get project by id."""
-    conn = get_connection()
-    try:
-        row = conn.execute(
-            "SELECT id, short_id, name, description, created_at, updated_at, status FROM projects WHERE id = ?",
-            (project_id,),
-        ).fetchone()
+    with connection(conn) as conn:
+        row = conn.execute(_SELECT_PROJECT_BY_ID, (project_id,)).fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
+
+
+def get_projects(project_ids: list[str], conn: sqlite3.Connection | None = None) -> list[dict[str, Any]]:
+    """Return projects by id in one query per 900 ids, in the order of project_ids (unknown ids skipped)."""
+    if not project_ids:
+        return []
+    with connection(conn) as conn:
+        by_id: dict[str, dict[str, Any]] = {}
+        for i in range(0, len(project_ids), IN_CHUNK):
+            chunk = list(project_ids[i:i + IN_CHUNK])
+            placeholders = ",".join("?" * len(chunk))
+            for r in conn.execute(f"{_SELECT_PROJECT} WHERE id IN ({placeholders})", chunk).fetchall():
+                by_id[r["id"]] = dict(r)
+        return [by_id[pid] for pid in project_ids if pid in by_id]
 
 
 def get_project_by_short_id(short_id: str) -> dict[str, Any] | None:
     """Get project by user-friendly short_id."""
     conn = get_connection()
     try:
-        row = conn.execute(
-            "SELECT id, short_id, name, description, created_at, updated_at, status FROM projects WHERE short_id = ?",
-            (short_id.strip().lower(),),
-        ).fetchone()
+        row = conn.execute(_SELECT_PROJECT_BY_SHORT_ID, (short_id.strip().lower(),)).fetchone()
         return dict(row) if row else None
     finally:
         conn.close()
 
 
+# Short-lived caches for short_id and id lookups made on every AI tool call (short_id resolution, project labels in
+# task lists). create/update/delete clear them; the TTL bounds staleness for changes made by the other process
+# (web UI vs Telegram bot). Misses are not cached.
+_SHORT_ID_CACHE_TTL = 30.0
+_SHORT_ID_CACHE_MAX = 256
+_short_id_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_id_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_short_id_cache_lock = threading.Lock()
+
+
+def _clear_project_caches() -> None:
+    with _short_id_cache_lock:
+        _short_id_cache.clear()
+        _id_cache.clear()
+
+
+def get_project_by_short_id_cached(short_id: str) -> dict[str, Any] | None:
+    """get_project_by_short_id through a short TTL cache. Returns a copy, so callers may modify it. Read paths only
+    (listing, finding, info): the entry can outlive a delete or rename made by the other process for up to the TTL,
+    so anything that writes the project id (task_create, task_update projects) must use get_project_by_short_id."""
+    key = short_id.strip().lower()
+    now = time.monotonic()
+    with _short_id_cache_lock:
+        hit = _short_id_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return dict(hit[1])
+    project = get_project_by_short_id(key)
+    if project is not None:
+        with _short_id_cache_lock:
+            if len(_short_id_cache) >= _SHORT_ID_CACHE_MAX:
+                _short_id_cache.clear()
+            _short_id_cache[key] = (now + _SHORT_ID_CACHE_TTL, dict(project))
+    return project
+
+
+def get_projects_cached(project_ids: list[str], conn: sqlite3.Connection | None = None) -> list[dict[str, Any]]:
+    """get_projects through the same short TTL cache: only ids not cached are queried (in one query). Returns copies.
+    For display only (project labels): an entry can outlive a delete or rename made by the other process for up to
+    the TTL, so never use it to pick ids that get written (use get_projects / get_project_by_short_id there)."""
+    now = time.monotonic()
+    found: dict[str, dict[str, Any]] = {}
+    with _short_id_cache_lock:
+        for pid in project_ids:
+            hit = _id_cache.get(pid)
+            if hit is not None and hit[0] > now:
+                found[pid] = dict(hit[1])
+    missing = [pid for pid in dict.fromkeys(project_ids) if pid not in found]
+    if missing:
+        fetched = get_projects(missing, conn=conn)
+        with _short_id_cache_lock:
+            if len(_id_cache) + len(fetched) > _SHORT_ID_CACHE_MAX:
+                _id_cache.clear()
+            for p in fetched:
+                _id_cache[p["id"]] = (now + _SHORT_ID_CACHE_TTL, dict(p))
+        found.update((p["id"], p) for p in fetched)
+    return [found[pid] for pid in project_ids if pid in found]
+
+
 def _incomplete_tasks_with_no_other_active_project(conn: sqlite3.Connection, project_id: str) -> list[str]:
     """Return task ids that are incomplete, in this project, and have no other active project (would be project-less if we archive)."""
+    # One grouped pass over the active memberships of this project's incomplete tasks (no per-task subquery).
     rows = conn.execute(
-        """SELECT t.id FROM tasks t
-           INNER JOIN task_projects tp ON tp.task_id = t.id AND tp.project_id = ?
-           WHERE t.status = 'incomplete'
-           AND (
-             SELECT COUNT(*) FROM task_projects tp2
-             INNER JOIN projects p ON p.id = tp2.project_id AND p.status = 'active'
-             WHERE tp2.task_id = t.id
-           ) = 1""",
-        (project_id,),
+        """SELECT tp.task_id FROM task_projects tp
+           INNER JOIN projects p ON p.id = tp.project_id AND p.status = 'active'
+           INNER JOIN tasks t ON t.id = tp.task_id AND t.status = 'incomplete'
+           WHERE tp.task_id IN (SELECT task_id FROM task_projects WHERE project_id = ?)
+           GROUP BY tp.task_id
+           HAVING COUNT(*) = 1 AND MAX(tp.project_id = ?) = 1""",
+        (project_id, project_id),
     ).fetchall()
     return [r[0] for r in rows]
 
@@ -194,7 +271,8 @@ def update_project(
         params.append(project_id)
         conn.execute(f"UPDATE projects SET {', '.join(updates)} WHERE id = ?", params)
         conn.commit()
-        return get_project(project_id)
+        _clear_project_caches()
+        return get_project(project_id, conn=conn)
     finally:
         conn.close()
 
@@ -203,12 +281,12 @@ def delete_project(project_id: str) -> bool:
     """Delete project and its task associations. Returns True if deleted."""
     conn = get_connection()
     try:
-        row = conn.execute("SELECT id FROM projects WHERE id = ?", (project_id,)).fetchone()
-        if not row:
-            return False
+        # Both deletes commit together; the projects rowcount says whether the project existed.
         conn.execute("DELETE FROM task_projects WHERE project_id = ?", (project_id,))
-        conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+        deleted = conn.execute("DELETE FROM projects WHERE id = ?", (project_id,)).rowcount > 0
         conn.commit()
-        return True
+        if deleted:
+            _clear_project_caches()
+        return deleted
     finally:
         conn.close()
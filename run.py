@@ -12,7 +12,6 @@ import logging
 import signal
 import subprocess
 import sys
-import time
 from pathlib import Path
 
 # Ensure app loggers (spaztick.api, task_service) emit to the same stream as uvicorn
@@ -70,9 +69,10 @@ def main() -> None:
     if _telegram_process:
         atexit.register(stop_telegram_bot)
         signal.signal(signal.SIGTERM, lambda *_: (stop_telegram_bot(), sys.exit(0)))
-        time.sleep(0.5)
+        # No startup wait: the bot is a separate process with its own DB connections (the DB was bootstrapped above)
+        # and reports its own errors on the shared stderr, so the web app has nothing to wait for.
 
-    # Start scheduler for list→Telegram cron (runs in this process)
+    # Start scheduler for list→Telegram cron (runs in this process; returns at once, the scheduler is a daemon thread)
     try:
         from telegram_cron import start_telegram_cron_scheduler
         start_telegram_cron_scheduler()
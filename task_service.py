@@ -9,7 +9,7 @@ import logging
 import re
 import sqlite3
 import uuid
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, timedelta
 from typing import Any
 
 try:
@@ -20,13 +20,18 @@ except ImportError:
     def _new_task_id() -> str:
         return str(uuid.uuid4())
 
-from database import get_connection, get_db_path, has_number_column, init_database
+from database import IN_CHUNK, connection, get_connection, get_db_path, has_number_column, init_database, now_iso as _now_iso
 
 logger = logging.getLogger("task_service")
 
 # Valid task statuses: only two
 STATUSES = frozenset({"incomplete", "complete"})
 PRIORITY_MIN, PRIORITY_MAX = 0, 3
+# Columns list_tasks(fields=...) may select
+TASK_COLUMNS = frozenset({
+    "id", "number", "title", "description", "notes", "status", "priority", "available_date", "due_date",
+    "recurrence", "recurrence_parent_id", "created_at", "updated_at", "completed_at", "flagged",
+})
 
 # Sentinel: pass for optional params to mean "don't change"; None means "set to null"
 _UNSET = object()
@@ -48,10 +53,6 @@ def _validate_available_due(available_date: str | None, due_date: str | None) ->
         raise ValueError("Available date cannot be after due date. Due date cannot be before available date.")
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-
 def _record_history(conn: sqlite3.Connection, task_id: str, event: str, payload: Any = None) -> None:
     conn.execute(
         "INSERT INTO task_history (task_id, timestamp, event, payload) VALUES (?, ?, ?, ?)",
@@ -156,18 +157,29 @@ def create_task(
         conn.close()
 
 
-def get_task(task_id: str) -> dict[str, Any] | None:
+def get_task(task_id: str, conn: sqlite3.Connection | None = None) -> dict[str, Any] | None:
     """Return one task by id with projects, tags, and dependencies."""
-    conn = get_connection()
-    try:
+    with connection(conn) as conn:
         row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
         if not row:
             return None
         out = _task_row_to_dict(row)
         _add_task_relations(conn, out)
         return out
-    finally:
-        conn.close()
+
+
+def get_tasks(task_ids: list[str], conn: sqlite3.Connection | None = None) -> list[dict[str, Any]]:
+    """Return tasks by id in one query, in the order of task_ids (unknown ids skipped). Minimal task dicts (no projects/tags/dependencies)."""
+    if not task_ids:
+        return []
+    with connection(conn) as conn:
+        by_id: dict[str, dict[str, Any]] = {}
+        for i in range(0, len(task_ids), IN_CHUNK):
+            chunk = list(task_ids[i:i + IN_CHUNK])
+            placeholders = ",".join("?" * len(chunk))
+            for r in conn.execute(f"SELECT * FROM tasks WHERE id IN ({placeholders})", chunk).fetchall():
+                by_id[r["id"]] = _task_row_to_dict(r)
+        return [by_id[tid] for tid in task_ids if tid in by_id]
 
 
 def _tags_for_task(
@@ -222,10 +234,9 @@ def _add_task_relations(conn: sqlite3.Connection, out: dict[str, Any]) -> None:
     ).fetchone() is not None
 
 
-def get_task_by_number(number: int) -> dict[str, Any] | None:
+def get_task_by_number(number: int, conn: sqlite3.Connection | None = None) -> dict[str, Any] | None:
     """Return one task by friendly number (user-facing id)."""
-    conn = get_connection()
-    try:
+    with connection(conn) as conn:
         if not has_number_column(conn):
             return None
         row = conn.execute("SELECT * FROM tasks WHERE number = ?", (number,)).fetchone()
@@ -234,21 +245,37 @@ def get_task_by_number(number: int) -> dict[str, Any] | None:
         out = _task_row_to_dict(row)
         _add_task_relations(conn, out)
         return out
-    finally:
-        conn.close()
 
 
-def get_tasks_that_depend_on(task_id: str) -> list[dict[str, Any]]:
+def get_tasks_that_depend_on(task_id: str, conn: sqlite3.Connection | None = None) -> list[dict[str, Any]]:
     """Return tasks that have this task as a dependency (subtasks). Minimal task dicts."""
-    conn = get_connection()
-    try:
+    with connection(conn) as conn:
         rows = conn.execute(
             "SELECT t.* FROM tasks t JOIN task_dependencies d ON t.id = d.task_id WHERE d.depends_on_task_id = ? ORDER BY t.created_at",
             (task_id,),
         ).fetchall()
         return [_task_row_to_dict(r) for r in rows]
-    finally:
-        conn.close()
+
+
+def get_tasks_that_depend_on_bulk(task_ids: list[str], conn: sqlite3.Connection | None = None) -> dict[str, list[dict[str, Any]]]:
+    """Subtasks for several tasks in one query per 900 ids: task_id -> tasks that depend on it (minimal dicts, by created_at). Tasks without subtasks are absent."""
+    if not task_ids:
+        return {}
+    with connection(conn) as conn:
+        out: dict[str, list[dict[str, Any]]] = {}
+        for i in range(0, len(task_ids), IN_CHUNK):
+            chunk = list(task_ids[i:i + IN_CHUNK])
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"""SELECT d.depends_on_task_id AS _parent_id, t.* FROM tasks t JOIN task_dependencies d ON t.id = d.task_id
+                    WHERE d.depends_on_task_id IN ({placeholders}) ORDER BY t.created_at""",
+                chunk,
+            ).fetchall()
+            # Each parent id is in exactly one chunk, so its subtasks stay in created_at order.
+            for r in rows:
+                d = _task_row_to_dict(r)
+                out.setdefault(d.pop("_parent_id"), []).append(d)
+        return out
 
 
 def list_tasks(
@@ -277,6 +304,8 @@ def list_tasks(
     blocked_by_task_id: str | None = None,
     blocking_task_id: str | None = None,
     limit: int = 500,
+    fields: list[str] | None = None,
+    conn: sqlite3.Connection | None = None,
 ) -> list[dict[str, Any]]:
     """List tasks with optional filters. Returns minimal task dicts (no projects/tags/deps).
     due_by, due_before, due_on, available_by, available_or_due_by, completed_by, completed_after are ISO date strings (YYYY-MM-DD).
@@ -292,10 +321,17 @@ def list_tasks(
     inbox: if True, only tasks that have no project (inbox = unassigned). Ignored if project_id/project_ids set.
     tags: list of tag names; tag_mode "any" = task has any of these (OR), "all" = task has all (AND).
     project_ids: list of project ids; project_mode "any" = task in any of these (OR), "all" = task in all (AND).
+    fields: only select these TASK_COLUMNS (id is always included); hashtag tags then come only from the selected title/description/notes.
     """
-    conn = get_connection()
-    try:
-        sql = "SELECT * FROM tasks WHERE 1=1"
+    if fields:
+        unknown = set(fields) - TASK_COLUMNS
+        if unknown:
+            raise ValueError(f"unknown task fields: {sorted(unknown)}")
+        columns = ", ".join(dict.fromkeys(["id", *fields]))
+    else:
+        columns = "*"
+    with connection(conn) as conn:
+        sql = f"SELECT {columns} FROM tasks WHERE 1=1"
         params: list[Any] = []
         use_project_list = project_ids and len(project_ids) > 0
         use_tag_list = tags and len(tags) > 0
@@ -463,8 +499,6 @@ def list_tasks(
                 t["blocks"] = []
                 t["is_blocked"] = False
         return out
-    finally:
-        conn.close()
 
 
 def update_task(
@@ -523,7 +557,8 @@ def update_task(
             updates.append("recurrence = ?")
             rec_json = json.dumps(recurrence) if recurrence else None
             params.append(rec_json)
-            logger.info("[task_service] update_task %s writing recurrence: %s", task_id, (rec_json[:200] + "..." if rec_json and len(rec_json) > 200 else rec_json))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[task_service] update_task %s writing recurrence: %s", task_id, (rec_json[:200] + "..." if rec_json and len(rec_json) > 200 else rec_json))
         params.append(task_id)
         conn.execute(f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?", params)
         _record_history(conn, task_id, "updated", {"updated_at": now})
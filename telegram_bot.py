@@ -37,6 +37,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Messages handled at once; a burst of messages then reaches Ollama together instead of one after another.
+# Concurrency is across chats only: handle_message serializes each chat through _chat_locks.
+CONCURRENT_UPDATES = 4
+
+# One lock per chat, held for the whole of handle_message, so a chat's messages are handled one at a time and in
+# arrival order (asyncio.Lock wakes waiters FIFO): replies stay in order and a "yes" sees the pending confirm
+# stored by the previous turn.
+_chat_locks: dict[int, asyncio.Lock] = {}
+
 # Per-chat conversation history; cleared after successful tool (task_create / task_find)
 _chat_histories: dict[int, list[dict[str, str]]] = {}
 
@@ -164,18 +173,6 @@ async def cmd_history(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
     await update.message.reply_text(text)
 
 
-def _run_orchestrator(
-    user_message: str,
-    base_url: str,
-    model: str,
-    system_prefix: str,
-    history: list[dict[str, str]],
-) -> tuple[str, bool, dict | None, bool]:
-    """Sync orchestrator call (run in executor). Returns (response_text, tool_used, pending_confirm, used_fallback)."""
-    from orchestrator import run_orchestrator
-    return run_orchestrator(user_message, base_url, model, system_prefix, history=history, response_format="telegram")
-
-
 def _execute_pending_confirm_http(web_base_url: str, payload: dict) -> tuple[bool, str]:
     """POST to web app execute-pending-confirm. Returns (ok, message)."""
     url = f"{web_base_url.rstrip('/')}/api/execute-pending-confirm"
@@ -196,9 +193,16 @@ def _execute_pending_confirm_http(web_base_url: str, payload: dict) -> tuple[boo
 
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle incoming message: run orchestrator; when history is off, use pending_confirm for delete confirmations."""
+    """Handle incoming message under its chat's lock (see _chat_locks)."""
     if not update.message or not update.message.text:
         return
+    lock = _chat_locks.setdefault(update.message.chat.id, asyncio.Lock())
+    async with lock:
+        await _handle_message(update, context)
+
+
+async def _handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle incoming message: run orchestrator; when history is off, use pending_confirm for delete confirmations."""
     config = load_config()
     if not config.telegram_bot_token:
         await update.message.reply_text("Bot token not configured. Set it in the web UI.")
@@ -254,12 +258,10 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         system_prefix = f"{date_line}\n\n{system_prefix}".strip()
     effective_history = history if USE_HISTORY else []
     try:
-        loop = asyncio.get_event_loop()
-        response, tool_used, pending_confirm, used_fallback = await loop.run_in_executor(
-            None,
-            lambda: _run_orchestrator(text, base_url, model, system_prefix, effective_history),
+        from orchestrator import friendly_response_text, run_orchestrator_async
+        response, tool_used, pending_confirm, used_fallback = await run_orchestrator_async(
+            text, base_url, model, system_prefix, history=effective_history, response_format="telegram"
         )
-        from orchestrator import friendly_response_text
         response = friendly_response_text(response)
         if pending_confirm:
             # Store context so on "yes" we can send one-turn history and let the model confirm
@@ -305,6 +307,7 @@ def run_polling() -> None:
         .token(config.telegram_bot_token)
         .get_updates_read_timeout(30)
         .get_updates_connect_timeout(10)
+        .concurrent_updates(CONCURRENT_UPDATES)
         .build()
     )
     app.add_handler(CommandHandler("reset", cmd_reset))
@@ -338,6 +341,7 @@ async def run_webhook() -> None:
         Application.builder()
         .token(config.telegram_bot_token)
         .updater(None)
+        .concurrent_updates(CONCURRENT_UPDATES)
         .build()
     )
     application.add_handler(CommandHandler("reset", cmd_reset))
@@ -119,6 +119,10 @@ def put_config(body: ConfigUpdate) -> dict[str, str]:
     c.user_timezone = getattr(body, "user_timezone", "") or "UTC"
     c.api_key = getattr(body, "api_key", "") or ""
     c.save()
+    from database import clear_db_path_cache
+    from orchestrator import clear_user_timezone_cache
+    clear_db_path_cache()
+    clear_user_timezone_cache()
     return {"status": "saved"}
 
 
@@ -361,15 +365,16 @@ def api_update_task(task_id: str, body: dict):
         for pid in t.get("projects") or []:
             remove_task_project(task_id, pid)
         for pid in body.get("projects") or []:
-            if str(pid).strip():
-                add_task_project(task_id, str(pid).strip())
+            pid = str(pid).strip()
+            if pid:
+                add_task_project(task_id, pid)
     if "tags" in body:
         tags_val = body.get("tags")
         if tags_val is not None:
             if isinstance(tags_val, str):
                 tags_list = [tags_val.strip()] if tags_val.strip() else []
             else:
-                tags_list = [str(x).strip() for x in (tags_val if isinstance(tags_val, list) else []) if str(x).strip()]
+                tags_list = [tag for x in (tags_val if isinstance(tags_val, list) else []) if (tag := str(x).strip())]
             for tag in t.get("tags") or []:
                 remove_task_tag(task_id, tag)
             for tag in tags_list:
@@ -563,8 +568,9 @@ async def external_update_task(task_id: str, request: Request):
     if not isinstance(body, dict):
         raise HTTPException(status_code=400, detail="Body must be a JSON object")
     # Always log PUT body for recurrence debugging (INFO so it appears in default logs)
-    logger.info("[API] PUT /api/external/tasks/%s body_keys=%s recurrence_in_body=%s recurrence=%s",
-                task_id, list(body.keys()), "recurrence" in body, body.get("recurrence"))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[API] PUT /api/external/tasks/%s body_keys=%s recurrence_in_body=%s recurrence=%s",
+                    task_id, list(body.keys()), "recurrence" in body, body.get("recurrence"))
     if getattr(load_config(), "debug", False):
         logger.warning("[API] PUT /api/external/tasks/%s body keys: %s, recurrence in body: %s, body: %s",
                        task_id, list(body.keys()), "recurrence" in body, body)
@@ -603,15 +609,16 @@ async def external_update_task(task_id: str, request: Request):
         for pid in (t.get("projects") or []):
             remove_task_project(tid, pid)
         for pid in body.get("projects") or []:
-            if str(pid).strip():
-                add_task_project(tid, str(pid).strip())
+            pid = str(pid).strip()
+            if pid:
+                add_task_project(tid, pid)
     if "tags" in body:
         tags_val = body.get("tags")
         if tags_val is not None:
             if isinstance(tags_val, str):
                 tags_list = [tags_val.strip()] if tags_val.strip() else []
             else:
-                tags_list = [str(x).strip() for x in (tags_val if isinstance(tags_val, list) else []) if str(x).strip()]
+                tags_list = [tag for x in (tags_val if isinstance(tags_val, list) else []) if (tag := str(x).strip())]
             for tag in (t.get("tags") or []):
                 remove_task_tag(tid, tag)
             for tag in tags_list: